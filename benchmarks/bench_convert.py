@@ -0,0 +1,57 @@
+"""Token coercion throughput of :func:`cyclopts.convert`.
+
+Usage::
+
+    python benchmarks/bench_convert.py
+"""
+
+import array
+import sys
+import timeit
+import types
+from enum import Enum
+from pathlib import Path
+from typing import List, Literal, Optional, Tuple, Union
+
+from cyclopts import convert
+
+
+def main():
+    int_tokens = [str(i) for i in range(100_000)]
+    big_int_tokens = [str(2**62 + i) for i in range(1_000_000)]
+    hex_tokens = [hex(i) for i in range(1_000_000)]
+    path_tokens = [f"src/module_{i}.py" for i in range(10_000)]
+    region = Enum("Region", {f"REGION_{i}": i for i in range(500)})
+    region_tokens = [f"region-{i % 500}" for i in range(10_000)]
+    choice = Literal[tuple(f"choice-{i}" for i in range(100))]
+    choice_tokens = [f"choice-{i % 100}" for i in range(10_000)]
+    mixed_tokens = [(str(i), f"{i}.5", f"name-{i}")[i % 3] for i in range(10_000)]
+
+    cases = (
+        ("List[int], 100k tokens", lambda: convert(List[int], *int_tokens), 5),
+        ("List[int], 1M 64-bit tokens", lambda: convert(List[int], *big_int_tokens), 1),
+        ("List[int], 1M hex tokens", lambda: convert(List[int], *hex_tokens), 1),
+        ("Tuple[int, str], 10k calls", lambda: [convert(Tuple[int, str], "1", "foo") for _ in range(10_000)], 5),
+        ("Optional[List[Path]], 10k tokens", lambda: convert(Optional[List[Path]], *path_tokens), 5),
+        ("List[Enum], 500 members, 10k tokens", lambda: convert(List[region], *region_tokens), 5),
+        ("List[Literal], 100 choices, 10k tokens", lambda: convert(List[choice], *choice_tokens), 5),
+        ("List[Union[int, float, str]], 10k tokens", lambda: convert(List[Union[int, float, str]], *mixed_tokens), 5),
+    )
+    if sys.version_info >= (3, 9):
+        int_array = array.array[int] if sys.version_info >= (3, 12) else types.GenericAlias(array.array, (int,))
+        cases += (("array.array[int], 1M 64-bit tokens", lambda: convert(int_array, *big_int_tokens), 1),)
+    try:
+        import numpy as np
+        import numpy.typing as npt
+    except ImportError:
+        pass
+    else:
+        cases += (("NDArray[int64], 1M 64-bit tokens", lambda: convert(npt.NDArray[np.int64], *big_int_tokens), 1),)
+
+    for name, f, number in cases:
+        best = min(timeit.repeat(f, number=number, repeat=3)) / number
+        print(f"{name:>40}: {best * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Cost of printing a help-page, with and without the on-disk help cache.
+
+Usage::
+
+    python benchmarks/bench_help.py
+"""
+
+import io
+import tempfile
+import timeit
+
+from rich.console import Console
+
+from cyclopts import App
+
+N_COMMANDS = 50
+
+
+_docstring = """Some **command** number {i}.
+
+    A longer description with ``inline code`` and a list:
+
+    * first item
+    * second item
+
+    Parameters
+    ----------
+    a: int
+        Help for ``a``.
+    b: str
+        Help for ``b``.
+    verbose: bool
+        Help for ``verbose``.
+    """
+
+
+def _make_command(i: int):
+    def command(a: int, b: str = "foo", *, verbose: bool = False):
+        pass
+
+    command.__doc__ = _docstring.format(i=i)
+    return command
+
+
+_commands = [_make_command(i) for i in range(N_COMMANDS)]
+
+
+def build(help_cache_dir=None) -> App:
+    app = App(name="bench", help="Benchmark application.", help_cache_dir=help_cache_dir)
+    for i, command in enumerate(_commands):
+        app.command(command, name=f"command-{i}")
+    return app
+
+
+def _console() -> Console:
+    return Console(file=io.StringIO(), width=100, force_terminal=True)
+
+
+def main():
+    number, repeat = 20, 5
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for label, app in (("uncached", build()), ("cached", build(cache_dir))):
+            for tokens in ([], ["command-0"]):
+                app.help_print(tokens, console=_console())  # Warm-up; populates the cache.
+                best = min(
+                    timeit.repeat(
+                        lambda app=app, tokens=tokens: app.help_print(tokens, console=_console()),
+                        number=number,
+                        repeat=repeat,
+                    )
+                )
+                print(f"help_print({tokens!r}) {label}: {best / number * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Parsing throughput for invocations with many tokens.
+
+Usage::
+
+    python benchmarks/bench_parse.py
+"""
+
+import timeit
+from typing import List
+
+from cyclopts import App
+
+
+def main():
+    app = App()
+
+    @app.default
+    def default(files: List[str], *, verbose: bool = False):
+        pass
+
+    mixed_app = App()
+
+    @mixed_app.default
+    def mixed(src: str, dst: str, *files: str, **defines: str):
+        pass
+
+    files = [f"data/file_{i}.txt" for i in range(10_000)]
+    negatives = [f"-{i}.5" for i in range(10_000)]
+    mixed_tokens = ["src", "dst"]
+    for i in range(2_500):
+        mixed_tokens.extend((f"data/file_{i}.txt", f"--key-{i}", "value", f"--flag-{i}=value"))
+
+    cases = (
+        ("10k file names", app, files + ["--verbose"]),
+        ("10k negative numbers", app, ["--files", *negatives]),
+        ("10k mixed tokens", mixed_app, mixed_tokens),
+    )
+    for name, app_, tokens in cases:
+        best = min(timeit.repeat(lambda: app_.parse_args(tokens), number=5, repeat=3)) / 5  # noqa: B023
+        print(f"{name:>22}: {best * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
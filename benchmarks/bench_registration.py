@@ -0,0 +1,46 @@
+"""Cost of registering commands, as paid at import-time of a large CLI.
+
+Usage::
+
+    python benchmarks/bench_registration.py
+"""
+
+import timeit
+import tracemalloc
+
+from cyclopts import App
+
+N_COMMANDS = 1_000
+N_COMMANDS_MEMORY = 5_000
+
+
+def _command(a: int, b: str = "foo"):
+    """Some command."""
+
+
+def register(n_commands: int = N_COMMANDS):
+    app = App()
+    for i in range(n_commands):
+        app.command(_command, name=f"command-{i}")
+    return app
+
+
+def main():
+    number, repeat = 3, 5
+    best = min(timeit.repeat(register, number=number, repeat=repeat)) / number
+    print(f"Registering {N_COMMANDS} commands: {best * 1e3:.1f} ms ({best / N_COMMANDS * 1e6:.1f} us/command)")
+
+    tracemalloc.start()
+    app = register(N_COMMANDS_MEMORY)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"Memory of {N_COMMANDS_MEMORY} commands: {current / 2**20:.1f} MiB ({current / N_COMMANDS_MEMORY:.0f} B/command)"
+    )
+
+    best = min(timeit.repeat(lambda: app.parse_args(["command-0", "1"]), number=1000, repeat=repeat)) / 1000
+    print(f"Parsing a command of {N_COMMANDS_MEMORY}: {best * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
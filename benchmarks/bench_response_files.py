@@ -0,0 +1,51 @@
+"""Expansion of a large ``@args.txt`` response file.
+
+Usage::
+
+    python benchmarks/bench_response_files.py
+"""
+
+import shlex
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from cyclopts.bind import expand_response_files
+
+
+def main():
+    n_tokens = 100_000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "args.txt"
+        with path.open("w") as f:
+            for i in range(n_tokens):
+                f.write(f"data/shard_{i:08d}.parquet\n" if i % 10 else f"'data/shard {i:08d}.parquet'\n")
+        size = path.stat().st_size / 2**20
+        print(f"{n_tokens} tokens, {size:.1f} MiB")
+
+        def read_shlex():
+            return shlex.split(path.read_text())
+
+        cases = (
+            ("shlex.split(read_text())", read_shlex),
+            ("expand_response_files", lambda: expand_response_files([f"@{path}"])),
+        )
+        for name, f in cases:
+            start = time.perf_counter()
+            tokens = f()
+            elapsed = time.perf_counter() - start
+            assert len(tokens) == n_tokens
+            del tokens
+
+            # Separate run; tracing allocations heavily skews timing.
+            tracemalloc.start()
+            f()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(f"{name:>22}: {elapsed * 1e3:.0f} ms, peak {peak / 2**20:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Signature lookup of functions using postponed (string) annotations.
+
+Usage::
+
+    python benchmarks/bench_signature.py
+"""
+
+from __future__ import annotations
+
+import inspect
+import sys
+import timeit
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from cyclopts.utils import signature
+
+# Stringified annotations are what is being measured; keep the ``typing`` aliases.
+# ruff: noqa: UP006, UP007
+
+
+def command(
+    src: Path,
+    dst: Optional[Path] = None,
+    *,
+    jobs: int = 1,
+    tags: List[str] = [],  # noqa: B006
+    mapping: Dict[str, int] = {},  # noqa: B006
+    shape: Tuple[int, int] = (1, 1),
+    verbose: bool = False,
+):
+    pass
+
+
+def main():
+    if sys.version_info >= (3, 10):
+        uncached = lambda: inspect.signature(command, eval_str=True)  # noqa: E731
+    else:  # pragma: no cover
+        uncached = lambda: inspect.signature(command)  # noqa: E731
+    cached = lambda: signature(command)  # noqa: E731
+
+    number = 10_000
+    for name, f in (("inspect.signature", uncached), ("cyclopts.utils.signature", cached)):
+        best = min(timeit.repeat(f, number=number, repeat=5)) / number
+        print(f"{name:>26}: {best * 1e6:.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
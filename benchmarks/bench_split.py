@@ -0,0 +1,40 @@
+"""Tokenizing long command-line strings, ``shlex.split`` vs ``cyclopts.bind.split``.
+
+Usage::
+
+    python benchmarks/bench_split.py
+"""
+
+import shlex
+import timeit
+
+from cyclopts.bind import split
+
+
+def _command(size: int) -> str:
+    pieces, length, i = [], 0, 0
+    while length < size:
+        if i % 10 == 0:
+            piece = f"'data/shard {i:08d}.parquet'"
+        elif i % 10 == 5:
+            piece = f'--name="job {i}"'
+        else:
+            piece = f"data/shard_{i:08d}.parquet"
+        pieces.append(piece)
+        length += len(piece) + 1
+        i += 1
+    return " ".join(pieces)
+
+
+def main():
+    for size in (10_000, 100_000, 1_000_000):
+        s = _command(size)
+        assert split(s) == shlex.split(s)
+        number = max(1, 1_000_000 // size)
+        for name, f in (("shlex.split", shlex.split), ("split", split)):
+            best = min(timeit.repeat(lambda: f(s), number=number, repeat=3)) / number  # noqa: B023
+            print(f"{len(s) / 1e3:>6.0f} KB {name:>12}: {best * 1e3:8.2f} ms, {len(s) / best / 2**20:7.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
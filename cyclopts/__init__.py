@@ -12,6 +12,7 @@ __all__ = [
     "InvalidCommandError",
     "MissingArgumentError",
     "Parameter",
+    "ResponseFileError",
     "UnknownOptionError",
     "UnusedCliTokensError",
     "ValidationError",
@@ -21,22 +22,63 @@ __all__ = [
     "validators",
 ]
 
-from cyclopts._convert import convert
-from cyclopts.core import App
-from cyclopts.exceptions import (
-    CoercionError,
-    CommandCollisionError,
-    CycloptsError,
-    DocstringError,
-    InvalidCommandError,
-    MissingArgumentError,
-    UnknownOptionError,
-    UnusedCliTokensError,
-    ValidationError,
-)
-from cyclopts.group import Group
-from cyclopts.parameter import Parameter
-from cyclopts.protocols import Dispatcher
-from cyclopts.utils import default_name_transform
-
-from . import types, validators
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cyclopts._convert import convert
+    from cyclopts.core import App
+    from cyclopts.exceptions import (
+        CoercionError,
+        CommandCollisionError,
+        CycloptsError,
+        DocstringError,
+        InvalidCommandError,
+        MissingArgumentError,
+        ResponseFileError,
+        UnknownOptionError,
+        UnusedCliTokensError,
+        ValidationError,
+    )
+    from cyclopts.group import Group
+    from cyclopts.parameter import Parameter
+    from cyclopts.protocols import Dispatcher
+    from cyclopts.utils import default_name_transform
+
+    from . import types, validators
+
+# Exports are imported on first access to keep ``import cyclopts`` cheap.
+_lazy_exports = {
+    "App": "cyclopts.core",
+    "CoercionError": "cyclopts.exceptions",
+    "CommandCollisionError": "cyclopts.exceptions",
+    "CycloptsError": "cyclopts.exceptions",
+    "Dispatcher": "cyclopts.protocols",
+    "DocstringError": "cyclopts.exceptions",
+    "Group": "cyclopts.group",
+    "InvalidCommandError": "cyclopts.exceptions",
+    "MissingArgumentError": "cyclopts.exceptions",
+    "Parameter": "cyclopts.parameter",
+    "ResponseFileError": "cyclopts.exceptions",
+    "UnknownOptionError": "cyclopts.exceptions",
+    "UnusedCliTokensError": "cyclopts.exceptions",
+    "ValidationError": "cyclopts.exceptions",
+    "convert": "cyclopts._convert",
+    "default_name_transform": "cyclopts.utils",
+}
+_lazy_submodules = {"types", "validators"}
+
+
+def __getattr__(name: str):
+    # Unlike ``importlib.import_module``, ``__import__`` is reported by ``python -X importtime``.
+    if name in _lazy_exports:
+        value = getattr(__import__(_lazy_exports[name], fromlist=[name]), name)
+    elif name in _lazy_submodules:
+        value = __import__(f"{__name__}.{name}", fromlist=[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,9 @@
+import array
 import collections.abc
 import inspect
+import re
 import sys
+from contextlib import suppress
 from enum import Enum
 from functools import partial
 from inspect import isclass
@@ -9,9 +12,11 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Literal,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -20,6 +25,8 @@ from typing import (
     get_origin,
 )
 
+from attrs import frozen
+
 from cyclopts.exceptions import CoercionError
 from cyclopts.utils import default_name_transform, is_union
 
@@ -44,26 +51,60 @@ _implicit_iterable_type_mapping: Dict[Type, Type] = {
 
 _iterable_types = {list, set}
 
+# ``array.array`` element type to typecode.
+_array_typecodes: Dict[Type, str] = {
+    int: "q",
+    float: "d",
+}
+
+
+_bool_false_strings = frozenset({"no", "n", "0", "false", "f"})
+_bool_true_strings = frozenset({"yes", "y", "1", "true", "t"})
+_bool_strings = _bool_false_strings | _bool_true_strings
+
 
 def _bool(s: str) -> bool:
     s = s.lower()
-    if s in {"no", "n", "0", "false", "f"}:
+    if s in _bool_false_strings:
         return False
-    elif s in {"yes", "y", "1", "true", "t"}:
+    elif s in _bool_true_strings:
         return True
     else:
         raise CoercionError(target_type=bool, input_value=s)
 
 
+_radix_characters = frozenset("xXbBoO")
+_sign_characters = frozenset("+-")
+
+
 def _int(s: str) -> int:
-    s = s.lower()
-    if s.startswith("0x"):
-        return int(s, 16)
-    elif s.startswith("0b"):
-        return int(s, 2)
-    else:
-        # Casting to a float first allows for things like "30.0"
-        return int(round(float(s)))
+    if s[1:2] in _radix_characters or (s[:1] in _sign_characters and s[2:3] in _radix_characters):
+        # Hexadecimal, binary and octal; e.g. "0xFF", "-0b1010", "0o_777".
+        return int(s, 0)
+
+    try:
+        # Exact fast-path for plain decimal integers.
+        return int(s)
+    except ValueError:
+        pass
+
+    # Fractional/exponential input, like "30.0" or "1e3"; ``Decimal`` keeps large values exact.
+    from decimal import Decimal, InvalidOperation
+
+    try:
+        value = Decimal(s)
+    except InvalidOperation:
+        raise ValueError(f"invalid literal for int(): {s!r}") from None
+    # Rounding takes time quadratic in the exponent; a short token like "1e500000" would stall.
+    if not value.is_finite() or value.adjusted() >= _max_int_digits():
+        raise CoercionError(target_type=int, input_value=s)
+    return int(round(value))
+
+
+def _max_int_digits() -> int:
+    """Same limit as ``int(s)`` imposes on decimal strings (:func:`sys.get_int_max_str_digits`)."""
+    get_int_max_str_digits = getattr(sys, "get_int_max_str_digits", None)  # Python >=3.11, and some patch releases.
+    return (get_int_max_str_digits and get_int_max_str_digits()) or 4300
 
 
 def _bytes(s: str) -> bytes:
@@ -83,124 +124,365 @@ _converters = {
 }
 
 
-def _convert_tuple(
-    type_: Type[Any],
-    *args: str,
-    converter: Optional[Callable[[Type, str], Any]],
-    name_transform: Callable[[str], str],
-) -> Tuple:
-    convert = partial(_convert, converter=converter, name_transform=name_transform)
-    inner_types = tuple(x for x in get_args(type_) if x is not ...)
-    inner_token_count, consume_all = token_count(type_)
-    if consume_all:
-        # variable-length tuple (list-like)
-        remainder = len(args) % inner_token_count
-        if remainder:
-            raise CoercionError(
-                msg=f"Incorrect number of arguments: expected multiple of {inner_token_count} but got {len(args)}."
-            )
-        if len(inner_types) == 1:
-            inner_type = inner_types[0]
-        elif len(inner_types) == 0:
-            inner_type = str
-        else:
-            raise ValueError("A tuple must have 0 or 1 inner-types.")
+# A compiled converter coerces a single ``element`` (a token, or a sequence of tokens) into its type.
+_Compiled = Callable[[Any], Any]
 
-        if inner_token_count == 1:
-            out = tuple(convert(inner_type, x) for x in args)
-        else:
-            out = tuple(
-                convert(inner_type, args[i : i + inner_token_count]) for i in range(0, len(args), inner_token_count)
-            )
-        return out
-    else:
-        # Fixed-length tuple
-        if inner_token_count != len(args):
-            raise CoercionError(msg=f"Incorrect number of arguments: expected {inner_token_count} but got {len(args)}.")
-        args_per_convert = [token_count(x)[0] for x in inner_types]
-        it = iter(args)
-        batched = [[next(it) for _ in range(size)] for size in args_per_convert]
-        batched = [elem[0] if len(elem) == 1 else elem for elem in batched]
-        out = tuple(convert(inner_type, arg) for inner_type, arg in zip(inner_types, batched))
-    return out
+# Keyed by identity; each value holds strong references to the key objects so ids cannot be reused.
+_compiled_cache: Dict[Tuple[int, int, int], Tuple[Any, Any, Any, _Compiled]] = {}
+_COMPILED_CACHE_MAXSIZE = 1024
 
 
-def _convert(
-    type_,
-    element,
-    *,
+def _compile(
+    type_: Any,
     converter: Optional[Callable[[Type, str], Any]],
     name_transform: Callable[[str], str],
-):
-    """Inner recursive conversion function for public ``convert``.
+) -> _Compiled:
+    """Get the cached specialized converter for ``type_``.
 
-    Parameters
-    ----------
-    converter: Callable
-    name_transform: Callable
+    All type introspection is performed here, once, so that the returned callable
+    only performs the actual conversion.
     """
-    convert = partial(_convert, converter=converter, name_transform=name_transform)
-    convert_tuple = partial(_convert_tuple, converter=converter, name_transform=name_transform)
-    origin_type = get_origin(type_)
-    inner_types = [resolve(x) for x in get_args(type_)]
+    key = (id(type_), id(converter), id(name_transform))
+    try:
+        return _compiled_cache[key][3]
+    except KeyError:
+        pass
+
+    try:
+        compiled = _compile_uncached(type_, converter, name_transform)
+    except Exception as e:
+        # Defer the error to conversion-time; e.g. a Union may still succeed with another member.
+        compiled = partial(_raise, e)
+
+    if len(_compiled_cache) >= _COMPILED_CACHE_MAXSIZE:
+        _compiled_cache.clear()
+    _compiled_cache[key] = (type_, converter, name_transform, compiled)
+    return compiled
+
+
+def _raise(exception: Exception, *args):
+    raise exception.with_traceback(None)
+
+
+def _compile_uncached(
+    type_: Any,
+    converter: Optional[Callable[[Type, str], Any]],
+    name_transform: Callable[[str], str],
+) -> _Compiled:
+    compile = partial(_compile, converter=converter, name_transform=name_transform)
 
     if type_ in _implicit_iterable_type_mapping:
-        return convert(_implicit_iterable_type_mapping[type_], element)
+        return compile(_implicit_iterable_type_mapping[type_])
+
+    origin_type = get_origin(type_)
 
     if origin_type is collections.abc.Iterable:
+        inner_types = [resolve(x) for x in get_args(type_)]
         assert len(inner_types) == 1
-        return convert(List[inner_types[0]], element)  # pyright: ignore[reportGeneralTypeIssues]
+        return compile(List[inner_types[0]])  # pyright: ignore[reportGeneralTypeIssues]
     elif is_union(origin_type):
-        for t in inner_types:
-            if t is NoneType:
-                continue
-            try:
-                return convert(t, element)
-            except Exception:
-                pass
-        else:
+        members = [
+            (compile(t), _compile_union_member_rejecter(t, converter, name_transform))
+            for t in map(resolve, get_args(type_))
+            if t is not NoneType
+        ]
+
+        def convert_union(element):
+            is_token = isinstance(element, str)
+            for member, rejects in members:
+                if is_token and rejects is not None and rejects(element):
+                    # Skip members that would certainly raise.
+                    continue
+                try:
+                    return member(element)
+                except Exception:
+                    pass
             raise CoercionError(input_value=element, target_type=type_)
+
+        return convert_union
     elif origin_type is Literal:
+        choices = [(choice, compile(type(choice))) for choice in get_args(type_)]
+
+        def convert_literal(element):
+            for choice, choice_converter in choices:
+                try:
+                    res = choice_converter(element)
+                except Exception:
+                    continue
+                if res == choice:
+                    return res
+            raise CoercionError(input_value=element, target_type=type_)
+
+        if converter is not None:
+            # A custom converter may be impure; don't precompute.
+            return convert_literal
+
+        # Map each choice's canonical string to the value it converts to.
+        # Other spellings (e.g. "0x10" for 16) fall back to trying each choice.
+        lookup = {}
         for choice in get_args(type_):
+            with suppress(Exception):
+                lookup.setdefault(str(choice), convert_literal(str(choice)))
+
+        def convert_literal_lookup(element):
             try:
-                res = convert(type(choice), (element))
-            except Exception:
-                continue
-            if res == choice:
-                return res
-        else:
-            raise CoercionError(input_value=element, target_type=type_)
+                return lookup[element]
+            except (KeyError, TypeError):
+                return convert_literal(element)
+
+        return convert_literal_lookup
     elif origin_type in _iterable_types:  # NOT including tuple
-        count, _ = token_count(inner_types[0])
+        inner_type = resolve(get_args(type_)[0])
+        inner_converter = compile(inner_type)
+        count, _ = token_count(inner_type)
         if count > 1:
-            gen = zip(*[iter(element)] * count)
+            return lambda element: origin_type(map(inner_converter, zip(*[iter(element)] * count)))
+        elif inner_type is int and converter is None:
+            return partial(_bulk_int, origin_type, inner_converter)
         else:
-            gen = element
-        return origin_type(convert(inner_types[0], e) for e in gen)  # pyright: ignore[reportOptionalCall]
+            return lambda element: origin_type(map(inner_converter, element))
     elif origin_type is tuple:
-        if isinstance(element, str):
-            # E.g. Tuple[str] (Annotation: tuple containing a single string)
-            return convert_tuple(type_, element, converter=converter)
-        else:
-            return convert_tuple(type_, *element, converter=converter)
+        convert_tuple = _compile_tuple(type_, converter, name_transform)
+        return lambda element: convert_tuple((element,) if isinstance(element, str) else element)
+    elif (origin_type or type_) is array.array:
+        return _compile_array(type_, converter, name_transform)
+    elif _is_ndarray(origin_type or type_):
+        return _compile_ndarray(type_, converter, name_transform)
     elif isclass(type_) and issubclass(type_, Enum):
         if converter is None:
-            element_transformed = name_transform(element)
+            members = {}
             for member in type_:
-                if name_transform(member.name) == element_transformed:
-                    return member
-            raise CoercionError(input_value=element, target_type=type_)
+                # The first member with a matching name wins.
+                members.setdefault(name_transform(member.name), member)
+
+            def convert_enum(element):
+                try:
+                    return members[name_transform(element)]
+                except KeyError:
+                    raise CoercionError(input_value=element, target_type=type_) from None
+
+            return convert_enum
         else:
-            return converter(type_, element)
+            return partial(converter, type_)
     else:
         # The actual casting/converting of the underlying type is performed here.
+        if converter is None:
+            func = _converters.get(type_, type_)
+        else:
+            func = partial(converter, type_)
+
+        def convert_terminal(element):
+            try:
+                return func(element)
+            except ValueError:
+                raise CoercionError(input_value=element, target_type=type_) from None
+
+        return convert_terminal
+
+
+# Token-shape checks of builtin types; returns ``True`` if the conversion of the token would certainly fail.
+# Each pattern matches a superset of the accepted tokens, so a token that may convert is never rejected.
+_float_shape = r"\s*[+-]?(?:[\d_]*\.?[\d_]*(?:e[+-]?[\d_]*)?|inf(?:inity)?|s?nan\d*)\s*"
+_radix_int_shape = r"\s*[+-]?0[xbo]\w*\s*"
+_is_float_shaped = re.compile(_float_shape, re.IGNORECASE).fullmatch
+_is_int_shaped = re.compile(f"{_float_shape}|{_radix_int_shape}", re.IGNORECASE).fullmatch
+_has_complex_characters = re.compile(r"\d|inf|nan|j", re.IGNORECASE).search
+_rejecters: Dict[Any, Callable[[str], bool]] = {
+    # Fractional and exponential tokens are valid ``int`` input; see ``_int``.
+    int: lambda s: _is_int_shaped(s) is None,
+    float: lambda s: _is_float_shaped(s) is None,
+    complex: lambda s: _has_complex_characters(s) is None,
+    bool: lambda s: s.lower() not in _bool_strings,
+}
+
+
+def _compile_union_member_rejecter(
+    type_: Any,
+    converter: Optional[Callable[[Type, str], Any]],
+    name_transform: Callable[[str], str],
+) -> Optional[Callable[[str], bool]]:
+    """Get a check if a token certainly cannot be converted to union member ``type_``.
+
+    Allows skipping the member without raising (and catching) an exception.
+    Returns ``None`` if the member must be tried.
+    """
+    if converter is not None:
+        # A custom converter may accept anything.
+        return None
+    if isclass(type_) and issubclass(type_, Enum):
+        names = frozenset(name_transform(member.name) for member in type_)
+        return lambda s: name_transform(s) not in names
+    return _rejecters.get(type_)
+
+
+def _bulk_int(container: Callable, fallback: _Compiled, elements: Iterable[str]):
+    """Convert many integer tokens at once.
+
+    Plain decimal integers (the vast majority) are converted by the builtin ``int``
+    in a single pass; otherwise every element goes through the full integer coercion.
+    """
+    try:
+        return container(map(int, elements))
+    except ValueError:
+        return container(map(fallback, elements))
+
+
+def _is_ndarray(type_: Any) -> bool:
+    # Only check for numpy if it has already been imported (i.e. by the annotation's module).
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and type_ is numpy.ndarray
+
+
+def _is_buffer_type(type_: Any) -> bool:
+    """If ``type_`` is a contiguous numeric buffer (``array.array`` or ``numpy.ndarray``)."""
+    return type_ is array.array or _is_ndarray(type_)
+
+
+def _compile_buffer(
+    container: Callable[[Iterable], Any],
+    inner_type: Type,
+    converter: Optional[Callable[[Type, str], Any]],
+    name_transform: Callable[[str], str],
+) -> _Compiled:
+    inner_converter = _compile(inner_type, converter, name_transform)
+
+    if inner_type is int and converter is None:
+        fill = partial(_bulk_int, container, inner_converter)
+    else:
+        fill = lambda element: container(map(inner_converter, element))  # noqa: E731
+
+    def convert_buffer(element):
         try:
-            if converter is None:
-                return _converters.get(type_, type_)(element)
+            return fill(element)
+        except OverflowError as e:
+            raise CoercionError(msg=str(e)) from None
+
+    return convert_buffer
+
+
+def _compile_array(
+    type_: Any,
+    converter: Optional[Callable[[Type, str], Any]],
+    name_transform: Callable[[str], str],
+) -> _Compiled:
+    """Specialized converter for ``array.array``.
+
+    ``array.array[int]`` and ``array.array[float]`` (Python >=3.12) map to typecodes
+    ``"q"`` and ``"d"``. A bare ``array.array`` is an array of floats.
+    """
+    args = get_args(type_)
+    inner_type = resolve(args[0]) if args else float
+    try:
+        typecode = _array_typecodes[inner_type]
+    except KeyError:
+        raise TypeError(f"Unsupported array.array element type: {inner_type}") from None
+    return _compile_buffer(partial(array.array, typecode), inner_type, converter, name_transform)
+
+
+def _compile_ndarray(
+    type_: Any,
+    converter: Optional[Callable[[Type, str], Any]],
+    name_transform: Callable[[str], str],
+) -> _Compiled:
+    """Specialized converter for ``numpy.ndarray``.
+
+    The dtype is taken from ``numpy.typing.NDArray[...]``; defaults to ``float64``.
+    """
+    import numpy as np
+
+    args = get_args(type_)
+    dtype_args = get_args(args[1]) if len(args) == 2 else ()
+    if dtype_args and isclass(dtype_args[0]) and issubclass(dtype_args[0], np.generic):
+        dtype = np.dtype(dtype_args[0])
+    else:
+        dtype = np.dtype(np.float64)
+
+    if dtype.kind in "iu":
+        inner_type = int
+    elif dtype.kind == "f":
+        inner_type = float
+    elif dtype.kind == "b":
+        inner_type = bool
+    else:
+        raise TypeError(f"Unsupported numpy dtype: {dtype}")
+    return _compile_buffer(partial(np.fromiter, dtype=dtype), inner_type, converter, name_transform)
+
+
+def _compile_tuple(
+    type_: Any,
+    converter: Optional[Callable[[Type, str], Any]],
+    name_transform: Callable[[str], str],
+) -> Callable[[Sequence[str]], Tuple]:
+    """Specialized converter for a tuple of tokens."""
+    compile = partial(_compile, converter=converter, name_transform=name_transform)
+    inner_types = tuple(x for x in get_args(type_) if x is not ...)
+    inner_token_count, consume_all = token_count(type_)
+
+    if consume_all:
+        # variable-length tuple (list-like)
+        if len(inner_types) == 1:
+            inner_converter = compile(inner_types[0])
+        elif len(inner_types) == 0:
+            inner_converter = compile(str)
+        else:
+            inner_converter = None
+        bulk_int = converter is None and len(inner_types) == 1 and inner_types[0] is int
+
+        def convert_variable_tuple(args):
+            remainder = len(args) % inner_token_count
+            if remainder:
+                raise CoercionError(
+                    msg=f"Incorrect number of arguments: expected multiple of {inner_token_count} but got {len(args)}."
+                )
+            if inner_converter is None:
+                raise ValueError("A tuple must have 0 or 1 inner-types.")
+
+            if inner_token_count == 1:
+                if bulk_int:
+                    return _bulk_int(tuple, inner_converter, args)
+                return tuple(map(inner_converter, args))
             else:
-                return converter(type_, element)
-        except ValueError:
-            raise CoercionError(input_value=element, target_type=type_) from None
+                return tuple(
+                    inner_converter(args[i : i + inner_token_count]) for i in range(0, len(args), inner_token_count)
+                )
+
+        return convert_variable_tuple
+    else:
+        # Fixed-length tuple
+        inner_converters = [compile(x) for x in inner_types]
+        args_per_convert = [token_count(x)[0] for x in inner_types]
+        is_trivial = all(x == 1 for x in args_per_convert)
+
+        def convert_fixed_tuple(args):
+            if inner_token_count != len(args):
+                raise CoercionError(
+                    msg=f"Incorrect number of arguments: expected {inner_token_count} but got {len(args)}."
+                )
+            if is_trivial:
+                return tuple(f(arg) for f, arg in zip(inner_converters, args))
+            it = iter(args)
+            batched = [[next(it) for _ in range(size)] for size in args_per_convert]
+            batched = [elem[0] if len(elem) == 1 else elem for elem in batched]
+            return tuple(f(arg) for f, arg in zip(inner_converters, batched))
+
+        return convert_fixed_tuple
+
+
+def _convert(
+    type_,
+    element,
+    *,
+    converter: Optional[Callable[[Type, str], Any]],
+    name_transform: Callable[[str], str],
+):
+    """Inner recursive conversion function for public ``convert``.
+
+    Parameters
+    ----------
+    converter: Callable
+    name_transform: Callable
+    """
+    return _compile(type_, converter, name_transform)(element)
 
 
 _unsupported_target_types = {dict}
@@ -219,6 +501,11 @@ def get_origin_and_validate(type_: Type):
 
 def resolve(type_: Any) -> Type:
     """Perform all simplifying resolutions."""
+    return get_hint_info(type_).hint
+
+
+def _resolve(type_: Any) -> Type:
+    """Uncached implementation of :func:`resolve`."""
     if type_ is inspect.Parameter.empty:
         return str
 
@@ -259,6 +546,108 @@ def resolve_annotated(type_: Any) -> Type:
     return type_
 
 
+@frozen
+class HintInfo:
+    """Analysis of a single type hint/annotation.
+
+    Obtained via :func:`get_hint_info`; everything here only depends on the annotation itself.
+    """
+
+    annotation: Any
+    "The original, unmodified annotation."
+
+    hint: Any
+    "Fully resolved type hint; ``Annotated`` and ``Optional`` stripped."
+
+    origin: Any
+    "``get_origin(hint)``."
+
+    args: Tuple[Any, ...]
+    "``get_args(hint)``; the unresolved inner types."
+
+    parameters: Tuple["Parameter", ...]
+    "Cyclopts :class:`Parameter` found in the ``Annotated`` metadata."
+
+    token_count: Optional[int]
+    "Number of tokens a single element consumes. ``None`` if the type is unsupported."
+
+    consume_all: bool
+    "Consume all remaining tokens if positional."
+
+    negatable: bool
+    "Eligible for automatically generated negative flags."
+
+
+# Keyed by ``id(annotation)``; annotations may be unhashable (e.g. ``Annotated`` metadata)
+# or compare equal while being different (``Union[int, str] == Union[str, int]``).
+# Each ``HintInfo`` holds a strong reference to its annotation, so an id cannot be reused
+# while its entry is alive.
+_hint_info_cache: Dict[int, HintInfo] = {}
+_HINT_INFO_CACHE_MAXSIZE = 4096
+
+
+def get_hint_info(annotation: Any) -> HintInfo:
+    """Get the cached :class:`HintInfo` for an annotation."""
+    try:
+        return _hint_info_cache[id(annotation)]
+    except KeyError:
+        pass
+
+    info = _analyze_hint(annotation)
+    if len(_hint_info_cache) >= _HINT_INFO_CACHE_MAXSIZE:
+        _hint_info_cache.clear()
+    _hint_info_cache[id(annotation)] = info
+    return info
+
+
+def _analyze_hint(annotation: Any) -> HintInfo:
+    from cyclopts.parameter import Parameter
+
+    hint = str if annotation is inspect.Parameter.empty else annotation
+    hint = resolve_optional(hint)
+
+    parameters = ()
+    if type(hint) is AnnotatedType:
+        parameters = tuple(x for x in hint.__metadata__ if isinstance(x, Parameter))
+        hint = get_args(hint)[0]
+    hint = _resolve(hint)
+
+    try:
+        count, consume_all = _token_count(hint)
+    except TypeError:
+        # Unsupported type; the error is raised by ``token_count`` only if it's actually needed.
+        count, consume_all = None, False
+
+    origin = get_origin(hint)
+    return HintInfo(
+        annotation=annotation,
+        hint=hint,
+        origin=origin,
+        args=get_args(hint),
+        parameters=parameters,
+        token_count=count,
+        consume_all=consume_all,
+        negatable=(origin or hint) in (bool, list, set),
+    )
+
+
+def parameter_annotation(type_: Any) -> Any:
+    """Get the annotation of an ``inspect.Parameter``, inferring it from the default value if not annotated.
+
+    Non-``inspect.Parameter`` inputs are returned unmodified.
+    """
+    if not isinstance(type_, inspect.Parameter):
+        return type_
+
+    annotation = type_.annotation
+    if annotation is inspect.Parameter.empty or get_hint_info(annotation).hint is Any:
+        if type_.default in (inspect.Parameter.empty, None):
+            return str
+        else:
+            return type(type_.default)
+    return annotation
+
+
 def convert(
     type_: Any,
     *args: str,
@@ -315,28 +704,60 @@ def convert(
     Any
         Coerced version of input ``*args``.
     """
+    return compile_converter(type_, converter=converter, name_transform=name_transform)(*args)
+
+
+def compile_converter(
+    type_: Any,
+    *,
+    converter: Optional[Callable[[Type, str], Any]] = None,
+    name_transform: Optional[Callable[[str], str]] = None,
+) -> Callable[..., Any]:
+    """Precompile :func:`convert` for ``type_``.
+
+    All type resolution and dispatch happens here, once; errors are deferred until the returned callable is invoked.
+
+    Returns
+    -------
+    Callable[..., Any]
+        Function with signature ``f(*args: str)``, equivalent to ``convert(type_, *args, ...)``.
+    """
     if name_transform is None:
         name_transform = default_name_transform
 
-    convert = partial(_convert, converter=converter, name_transform=name_transform)
-    convert_tuple = partial(_convert_tuple, converter=converter, name_transform=name_transform)
-    type_ = resolve(type_)
+    try:
+        type_ = resolve(type_)
+
+        if type_ is Any:
+            type_ = str
 
-    if type_ is Any:
-        type_ = str
+        type_ = _implicit_iterable_type_mapping.get(type_, type_)
 
-    type_ = _implicit_iterable_type_mapping.get(type_, type_)
+        origin_type = get_origin_and_validate(type_)
+    except Exception as e:
+        return partial(_raise, e)
 
-    origin_type = get_origin_and_validate(type_)
+    compiled = _compile(type_, converter, name_transform)
 
-    if origin_type is tuple:
-        return convert_tuple(type_, *args)
-    elif (origin_type or type_) in _iterable_types or origin_type is collections.abc.Iterable:
-        return convert(type_, args)
-    elif len(args) == 1:
-        return convert(type_, args[0])
+    if (
+        origin_type is tuple
+        or (origin_type or type_) in _iterable_types
+        or origin_type is collections.abc.Iterable
+        or _is_buffer_type(origin_type or type_)
+    ):
+
+        def convert_collated(*args: str):
+            return compiled(args)
+
+        return convert_collated
     else:
-        return [convert(type_, item) for item in args]
+
+        def convert_each(*args: str):
+            if len(args) == 1:
+                return compiled(args[0])
+            return [compiled(item) for item in args]
+
+        return convert_each
 
 
 def token_count(type_: Any) -> Tuple[int, bool]:
@@ -355,11 +776,16 @@ def token_count(type_: Any) -> Tuple[int, bool]:
         If this is ``True`` and positional, consume all remaining tokens.
         The returned number of tokens constitutes a single element of the iterable-to-be-parsed.
     """
-    from cyclopts.parameter import get_hint_parameter
+    info = get_hint_info(parameter_annotation(type_))
+    if info.token_count is None:
+        # Re-run the analysis to raise the informative exception.
+        _token_count(info.hint)
+        raise NotImplementedError  # pragma: no cover
+    return info.token_count, info.consume_all
 
-    annotation = get_hint_parameter(type_)[0]
 
-    annotation = resolve(annotation)
+def _token_count(annotation: Any) -> Tuple[int, bool]:
+    """Uncached implementation of :func:`token_count` for a resolved annotation."""
     origin_type = get_origin_and_validate(annotation)
 
     if (origin_type or annotation) is tuple:
@@ -374,5 +800,7 @@ def token_count(type_: Any) -> Tuple[int, bool]:
         return 1, True
     elif (origin_type in _iterable_types or origin_type is collections.abc.Iterable) and len(get_args(annotation)):
         return token_count(get_args(annotation)[0])[0], True
+    elif _is_buffer_type(origin_type or annotation):
+        return 1, True
     else:
         return 1, False
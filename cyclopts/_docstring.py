@@ -0,0 +1,72 @@
+"""Parsed docstring metadata, shared by help-page rendering and :class:`~cyclopts.resolve.ResolvedCommand`."""
+
+import inspect
+import weakref
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from attrs import field, frozen
+
+
+@frozen(eq=False)
+class DocstringMetadata:
+    short_description: Optional[str] = None
+    long_description: Optional[str] = None
+    params: Dict[str, Optional[str]] = field(factory=dict)
+    """Mapping of documented parameter names to their descriptions."""
+
+
+_empty_metadata = DocstringMetadata()
+
+# Keyed by function identity; entries are dropped when the function is garbage collected.
+# The docstring is stored alongside its metadata, so that a modified ``__doc__`` is re-parsed.
+_docstring_cache: "weakref.WeakKeyDictionary[Any, Tuple[Optional[str], DocstringMetadata]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def parse_docstring(doc: Optional[str]) -> DocstringMetadata:
+    """Addon to :func:`docstring_parser.parse` that double checks the `short_description`."""
+    if not doc:
+        return _empty_metadata
+
+    import docstring_parser
+
+    res = docstring_parser.parse(doc)
+    short_description, long_description = res.short_description, res.long_description
+    cleaned_doc = inspect.cleandoc(doc)
+    short = cleaned_doc.split("\n\n")[0]
+    if short_description != short:
+        if long_description is None:
+            long_description = short_description
+        elif short_description is not None:
+            long_description = short_description + "\n" + long_description
+        short_description = None
+    return DocstringMetadata(
+        short_description=short_description,
+        long_description=long_description,
+        params={param.arg_name: param.description for param in res.params},
+    )
+
+
+# Explicitly provided help strings aren't tied to a function.
+parse_help_string = lru_cache(maxsize=1024)(parse_docstring)
+
+
+def docstring_metadata(f: Any) -> DocstringMetadata:
+    """Cached :func:`parse_docstring` of ``f.__doc__``."""
+    doc = f.__doc__
+    key = f.__func__ if inspect.ismethod(f) else f
+    try:
+        cached_doc, metadata = _docstring_cache[key]
+    except KeyError:
+        pass
+    except TypeError:  # Not weak-referenceable, or not hashable.
+        return parse_docstring(doc)
+    else:
+        if cached_doc is doc:
+            return metadata
+
+    metadata = parse_docstring(doc)
+    _docstring_cache[key] = (doc, metadata)
+    return metadata
@@ -0,0 +1,186 @@
+"""On-disk cache of rendered help-pages; see :attr:`cyclopts.App.help_cache_dir`.
+
+A help-page is keyed by a fingerprint of everything that is displayed on it that
+can be read *without* parsing docstrings or resolving signatures:
+
+* The requested command chain and the console (type, width and color system).
+* For every app on the route, the meta-apps of the executing app and their commands:
+  names, raw help strings, usage, flags, ``default_parameter``, ``name_transform``,
+  groups (including their ``default_parameter``, ``validator`` and ``sort_key``)
+  and the ``default_command``.
+* The modification time of the source file of every ``default_command`` and of every
+  other callable above, so that editing a signature or a ``Parameter`` annotation
+  invalidates the cache.
+* ``cyclopts.__version__`` and the modification time of every cyclopts module.
+
+Other modules that a signature depends on, e.g. one defining an ``Enum`` whose members
+are listed as choices, are **not** tracked.
+"""
+
+import hashlib
+import os
+import sys
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import attrs
+
+import cyclopts
+
+# Changes to cyclopts itself invalidate the cache too; any module may affect rendering.
+_cyclopts_sources = sorted(Path(cyclopts.__file__).parent.rglob("*.py"))
+
+
+def _mtime(path: Union[None, str, Path], mtimes: Dict[Any, Optional[int]]) -> Optional[int]:
+    try:
+        return mtimes[path]
+    except KeyError:
+        pass
+    try:
+        mtime = Path(path).stat().st_mtime_ns  # pyright: ignore[reportArgumentType]
+    except (OSError, TypeError):
+        mtime = None
+    mtimes[path] = mtime
+    return mtime
+
+
+def _describe_command(command, mtimes: Dict[Any, Optional[int]]) -> str:
+    if command is None or isinstance(command, str):
+        # Lazily registered commands are described by their import path.
+        return repr(command)
+    module_name = getattr(command, "__module__", None)
+    module = sys.modules.get(module_name)  # pyright: ignore[reportArgumentType]
+    path = getattr(module, "__file__", None)
+    qualname = getattr(command, "__qualname__", type(command).__qualname__)
+    return repr((module_name, qualname, path, _mtime(path, mtimes)))
+
+
+def _describe_value(value, mtimes: Dict[Any, Optional[int]]) -> Any:
+    """Stable description of a configuration value, e.g. a :class:`.Group` or :class:`.Parameter`.
+
+    Values with an identity-based ``repr`` (e.g. ``<object at 0x...>``) only ever cause cache-misses.
+    """
+    if attrs.has(type(value)):
+        return (
+            type(value).__qualname__,
+            *((a.name, _describe_value(getattr(value, a.name), mtimes)) for a in attrs.fields(type(value)) if a.eq),
+        )
+    elif isinstance(value, (tuple, list)):
+        return tuple(_describe_value(x, mtimes) for x in value)
+    elif callable(value):
+        return _describe_command(value, mtimes)
+    return repr(value)
+
+
+def _describe_groups(groups, mtimes: Dict[Any, Optional[int]]) -> str:
+    return repr(_describe_value(tuple(groups), mtimes))
+
+
+def _describe_app(app, mtimes: Dict[Any, Optional[int]]) -> List[str]:
+    from cyclopts.core import _CommandEntry
+
+    if type(app) is _CommandEntry:
+        return [
+            repr(("entry", app.name, app.help, app.show)),
+            _describe_groups(app.group, mtimes),
+            _describe_command(app.command, mtimes),
+        ]
+    return [
+        repr(("app", app.name, app.help, app.usage, app.show, app.help_format)),
+        repr((app.help_flags, app.version_flags)),
+        repr(_describe_value((app.default_parameter, app._name_transform), mtimes)),
+        _describe_groups((*app.group, app.group_commands, app.group_arguments, app.group_parameters), mtimes),
+        _describe_command(app._default_command, mtimes),
+    ]
+
+
+def fingerprint(apps, meta_apps, command_chain: List[str], console) -> str:
+    """Hash of everything affecting the help-page of ``apps[-1]``.
+
+    Parameters
+    ----------
+    apps: List[App]
+        Route to the executing app.
+    meta_apps: List[App]
+        The executing app and its meta-apps; all of their commands are listed on the help-page.
+    command_chain: List[str]
+        Tokens that led to the executing app.
+    console
+        Console that the help-page would be printed to.
+    """
+    mtimes: Dict[Any, Optional[int]] = {}
+    parts = [
+        cyclopts.__version__,
+        *(repr(_mtime(path, mtimes)) for path in _cyclopts_sources),
+        repr(tuple(command_chain)),
+        repr(
+            (
+                type(console).__qualname__,
+                console.width,
+                getattr(console, "color_system", None),
+                getattr(console, "is_terminal", None),
+            )
+        ),
+    ]
+    for app in apps:
+        parts.extend(_describe_app(app, mtimes))
+    for meta_app in meta_apps:
+        parts.extend(_describe_app(meta_app, mtimes))
+        for name, command in meta_app._commands.items():
+            parts.append(repr(name))
+            parts.extend(_describe_app(command, mtimes))
+    return hashlib.sha256("\0".join(parts).encode("utf-8", "surrogatepass")).hexdigest()
+
+
+@contextmanager
+def capture(console):
+    """:meth:`~rich.console.Console.capture` without recording; the page is recorded once replayed."""
+    record = getattr(console, "record", False)
+    if record:
+        console.record = False
+    try:
+        with console.capture() as captured:
+            yield captured
+    finally:
+        if record:
+            console.record = True
+
+
+def replay(console, text: str) -> None:
+    """Print a rendered help-page through ``console``, respecting its capturing and recording."""
+    from cyclopts._plaintext import PlaintextConsole
+
+    if isinstance(console, PlaintextConsole):
+        console.print(text, end="")
+    elif console.record:
+        from rich.text import Text
+
+        # Re-parse the styles, so that they are exported as such (e.g. by ``console.export_html``).
+        console.print(Text.from_ansi(text), end="\n" if text.endswith("\n") else "", soft_wrap=True)
+    else:
+        from rich.segment import Segment, Segments
+
+        # Printed as-is; the rendered text already fits the console.
+        console.print(Segments([Segment(text)]), end="", crop=False)
+
+
+def load(cache_dir: Union[str, Path], key: str) -> Optional[str]:
+    """Read a cached help-page; returns :obj:`None` on cache-miss."""
+    try:
+        return (Path(cache_dir) / f"{key}.txt").read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def store(cache_dir: Union[str, Path], key: str, text: str) -> None:
+    """Atomically write a help-page to the cache; failures are silently ignored."""
+    cache_dir = Path(cache_dir)
+    tmp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(text, encoding="utf-8")
+        tmp_path.replace(cache_dir / f"{key}.txt")
+    except OSError:
+        with suppress(OSError):
+            tmp_path.unlink()
@@ -0,0 +1,132 @@
+"""Rich-free rendering of help-pages and errors.
+
+Mirrors the layout of the default :mod:`rich` rendering, without the cost of importing :mod:`rich`.
+Renderable Cyclopts objects implement ``__plaintext__(width) -> Optional[str]``
+alongside ``__rich__``.
+"""
+
+import io
+import re
+import shutil
+import sys
+from typing import IO, Any, List, Optional, Sequence
+
+_word_pattern = re.compile(r"\s*\S+\s*")
+
+
+class PlaintextConsole:
+    """Minimal stand-in for :class:`rich.console.Console` that prints Cyclopts objects as plain text.
+
+    Parameters
+    ----------
+    file: Optional[IO[str]]
+        Output stream. Defaults to ``sys.stdout`` at print-time.
+    width: Optional[int]
+        Width of the output. Defaults to the terminal width, or 80 if not a terminal.
+    """
+
+    def __init__(self, file: Optional[IO[str]] = None, width: Optional[int] = None):
+        self.file = file
+        self.width = shutil.get_terminal_size().columns if width is None else width
+
+    def capture(self) -> "_Capture":
+        """Context manager capturing printed output; mirrors :meth:`rich.console.Console.capture`."""
+        return _Capture(self)
+
+    def print(self, renderable: Any = "", end: str = "\n") -> None:
+        text = renderable if isinstance(renderable, str) else renderable.__plaintext__(self.width)
+        if text is not None:
+            file = sys.stdout if self.file is None else self.file
+            file.write(text + end)
+
+
+class _Capture:
+    def __init__(self, console: PlaintextConsole):
+        self._console = console
+        self._file = io.StringIO()
+
+    def __enter__(self) -> "_Capture":
+        self._previous_file, self._console.file = self._console.file, self._file
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._console.file = self._previous_file
+
+    def get(self) -> str:
+        return self._file.getvalue()
+
+
+def wrap(text: str, width: int) -> List[str]:
+    """Word-wrap ``text`` to ``width`` columns, preserving explicit newlines.
+
+    Follows :mod:`rich`'s algorithm: words longer than ``width`` start on a new line and are
+    then folded, and trailing whitespace is kept as long as it fits.
+    """
+    width = max(width, 1)
+    lines = []
+    for paragraph in text.split("\n"):
+        paragraph = paragraph.expandtabs(8)
+        line = ""
+        for word in _word_pattern.findall(paragraph) or [paragraph]:
+            word_length = len(word.rstrip())
+            if width - len(line) >= word_length:
+                line += word
+            elif word_length > width:
+                if line:
+                    lines.append(line)
+                while len(word) > width:
+                    lines.append(word[:width])
+                    word = word[width:]
+                line = word
+            else:
+                lines.append(line)
+                line = word
+        lines.append(line)
+    return [line[:width] + line[width:].rstrip() for line in lines]
+
+
+def panel(body: List[str], title: str, width: int) -> str:
+    """Draw a rounded box with a left-aligned ``title`` around the lines of ``body``.
+
+    Each line of ``body`` must fit within ``width - 4`` columns.
+    """
+    inner_width = width - 4
+    top = f"╭─ {title} "
+    lines = [top + "─" * (width - 1 - len(top)) + "╮"]
+    lines.extend(f"│ {line.ljust(inner_width)} │" for line in body)
+    lines.append("╰" + "─" * (width - 2) + "╯")
+    return "\n".join(lines)
+
+
+def table(rows: Sequence[Sequence[str]], width: int, fixed_widths: Sequence[Optional[int]] = ()) -> List[str]:
+    """Lay out ``rows`` in columns separated by a single space; the last column is word-wrapped.
+
+    Parameters
+    ----------
+    rows: Sequence[Sequence[str]]
+        Table cells; all rows must have the same number of columns.
+    width: int
+        Total available width.
+    fixed_widths: Sequence[Optional[int]]
+        Fixed content-width per leading column; ``None`` sizes a column to its contents.
+        Like :mod:`rich`, a fixed-width column is padded by 2 instead of 1.
+    """
+    if not rows:
+        return []
+    n_columns = len(rows[0])
+    column_widths = []
+    for index in range(n_columns - 1):
+        fixed_width = fixed_widths[index] if index < len(fixed_widths) else None
+        if fixed_width is None:
+            column_widths.append(max(len(row[index]) for row in rows) + 1)
+        else:
+            column_widths.append(fixed_width + 2)
+    indent = sum(column_widths)
+
+    lines = []
+    for row in rows:
+        prefix = "".join(cell.ljust(column_width) for cell, column_width in zip(row, column_widths))
+        description = wrap(row[-1], width - indent)
+        lines.append(prefix + description[0])
+        lines.extend(" " * indent + line for line in description[1:])
+    return lines
@@ -1,10 +1,11 @@
 import inspect
-import itertools
+import mmap
 import os
-import shlex
+import re
 import sys
 from contextlib import suppress
-from typing import Iterable, List, Tuple, Union
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Tuple, Union
 
 from cyclopts._convert import token_count
 from cyclopts.exceptions import (
@@ -12,24 +13,188 @@ from cyclopts.exceptions import (
     CycloptsError,
     MissingArgumentError,
     RepeatArgumentError,
+    ResponseFileError,
     UnknownOptionError,
     ValidationError,
 )
-from cyclopts.parameter import get_hint_parameter, validate_command
 from cyclopts.resolve import ResolvedCommand
-from cyclopts.utils import ParameterDict
+from cyclopts.utils import Sentinel
 
 
 def normalize_tokens(tokens: Union[None, str, Iterable[str]]) -> List[str]:
     if tokens is None:
         tokens = sys.argv[1:]  # Remove the executable
     elif isinstance(tokens, str):
-        tokens = shlex.split(tokens)
+        tokens = split(tokens)
     else:
         tokens = list(tokens)
     return tokens
 
 
+# A POSIX-shell-like token: unquoted characters, single/double-quoted strings, and backslash-escapes.
+# Each match consumes leading whitespace, then either a plain token (no quotes or escapes),
+# a token requiring unquoting, an erroneous character, or the end of the buffer.
+# Whitespace, quotes and escapes are identical to ``shlex.split``.
+_token_pattern_source = (
+    r"""[ \t\r\n]*(?:([^ \t\r\n'"\\]+)(?![^ \t\r\n])|((?:[^ \t\r\n'"\\]+|'[^']*'|"(?:[^"\\]|\\.)*"|\\.)+)|(.)|\Z)"""
+)
+_piece_pattern_source = r"""'([^']*)'|"((?:[^"\\]|\\.)*)"|\\(.)"""
+_double_quote_escape_pattern_source = r"""\\(["\\])"""
+_trailing_backslashes_pattern_source = r"""\\*\Z"""
+
+
+class _Tokenizer:
+    """POSIX-shell-like tokenizer for either ``str`` or ``bytes`` buffers.
+
+    Produces the same tokens (and errors) as ``shlex.split``, but scans
+    the buffer with regular expressions instead of character-at-a-time.
+    """
+
+    def __init__(self, encode: bool = False):
+        def _compile(source: str):
+            return re.compile(source.encode() if encode else source, re.DOTALL)
+
+        self.token_pattern = _compile(_token_pattern_source)
+        self.piece_pattern = _compile(_piece_pattern_source)
+        self.double_quote_escape_pattern = _compile(_double_quote_escape_pattern_source)
+        self.trailing_backslashes_pattern = _compile(_trailing_backslashes_pattern_source)
+        self.backslash = b"\\" if encode else "\\"
+        self.single_quote = b"'" if encode else "'"
+        self.unescape = rb"\1" if encode else r"\1"
+
+    def _unquote_piece(self, match):
+        single, double, escaped = match.groups()
+        if single is not None:
+            return single
+        elif double is not None:
+            # Within double quotes, only the double-quote and backslash may be escaped.
+            return self.double_quote_escape_pattern.sub(self.unescape, double)
+        else:
+            return escaped
+
+    def _error_reason(self, buffer, match) -> str:
+        error = match.group(3)
+        if error == self.backslash:
+            return "No escaped character"
+        elif error == self.single_quote:
+            return "No closing quotation"
+        # Unterminated double-quote; an odd number of trailing backslashes escapes the end of the buffer.
+        trailing = self.trailing_backslashes_pattern.search(buffer, match.end())
+        return "No escaped character" if (trailing.end() - trailing.start()) % 2 else "No closing quotation"
+
+    def iter_tokens(self, buffer) -> Iterator:
+        """Lazily tokenize ``buffer``.
+
+        Raises
+        ------
+        ValueError
+            Unterminated quotation or escape; same messages as ``shlex.split``.
+        """
+        piece_pattern_sub = self.piece_pattern.sub
+        unquote_piece = self._unquote_piece
+        for match in self.token_pattern.finditer(buffer):
+            token, quoted_token, error = match.groups()
+            if token is None:
+                if quoted_token is not None:
+                    token = piece_pattern_sub(unquote_piece, quoted_token)
+                elif error is not None:
+                    raise ValueError(self._error_reason(buffer, match))
+                else:
+                    continue
+            yield token
+
+
+_str_tokenizer = _Tokenizer()
+_bytes_tokenizer = _Tokenizer(encode=True)
+
+
+def split(s: str) -> List[str]:
+    """Split a command-line string into tokens.
+
+    Drop-in replacement for ``shlex.split(s)`` (POSIX mode, no comments) with identical quoting semantics.
+
+    Parameters
+    ----------
+    s: str
+        Command-line string.
+
+    Raises
+    ------
+    ValueError
+        Unterminated quotation or escape.
+
+    Returns
+    -------
+    List[str]
+        Tokens.
+    """
+    return list(_str_tokenizer.iter_tokens(s))
+
+
+def _iter_response_file(path: str) -> Iterator[str]:
+    """Lazily tokenize a response file.
+
+    The raw bytes of the file are memory-mapped and scanned in-place, instead of being read into
+    a single string; every yielded token is a new ``str``.
+    """
+    encoding = sys.getfilesystemencoding()
+    with Path(path).open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            try:
+                for token in _bytes_tokenizer.iter_tokens(buffer):
+                    # Same decoding as ``sys.argv``.
+                    yield token.decode(encoding, "surrogateescape")
+            except ValueError as e:
+                raise ResponseFileError(path=path, reason=str(e)) from None
+
+
+def expand_response_files(tokens: Iterable[str], max_depth: int = 8) -> List[str]:
+    """Replace each ``@path`` token with the tokens contained in the file at ``path``.
+
+    Parameters
+    ----------
+    tokens: Iterable[str]
+        CLI tokens, potentially containing ``@path`` tokens.
+    max_depth: int
+        Maximum nesting depth of response files referencing other response files.
+
+    Raises
+    ------
+    ResponseFileError
+        A response file could not be read, tokenized, or the ``max_depth`` was exceeded.
+
+    Returns
+    -------
+    List[str]
+        Expanded tokens.
+    """
+    out = []
+
+    def expand(tokens: Iterable[str], depth: int):
+        for token in tokens:
+            if len(token) < 2 or not token.startswith("@"):
+                out.append(token)
+                continue
+
+            path = token[1:]
+            if depth >= max_depth:
+                raise ResponseFileError(path=path, reason=f"Exceeded maximum nesting depth of {max_depth}")
+            try:
+                expand(_iter_response_file(path), depth + 1)
+            except OSError as e:
+                raise ResponseFileError(path=path, reason=e.strerror or str(e)) from None
+
+    expand(tokens, 0)
+    return out
+
+
+# Marks an unpopulated slot in the per-parse storage.
+# Per-parse storage is a list indexed by ``ParameterDescriptor.index``.
+_UNSET = Sentinel("UNSET")
+
+
 def _cli_kw_to_f_kw(cli_key: str):
     """Only used for converting unknown CLI key/value keys for ``**kwargs``."""
     assert cli_key.startswith("--")
@@ -38,184 +203,200 @@ def _cli_kw_to_f_kw(cli_key: str):
     return cli_key
 
 
-def _parse_kw_and_flags(command: ResolvedCommand, tokens, mapping):
-    cli2kw = command.cli2parameter
+def _parse_kw_and_flags(command: ResolvedCommand, tokens: List[str], tags: List[int], mapping: List[Any]):
+    """Single cursor-based pass over ``tokens``, consuming keywords, flags and their values.
 
-    kwargs_iparam = next((x for x in command.iparam_to_cparam.keys() if x.kind == x.VAR_KEYWORD), None)
+    Returns
+    -------
+    unused_tokens: List[str]
+        Tokens that were not consumed; typically positional values.
+    unused_tags: List[int]
+        Classifications of ``unused_tokens``.
+    """
+    cli2descriptor = command.cli2descriptor
+    kwargs_descriptor = command.var_keyword_descriptor
 
-    if kwargs_iparam:
-        mapping[kwargs_iparam] = {}
+    kwargs_mapping = {}
+    if kwargs_descriptor:
+        mapping[kwargs_descriptor.index] = kwargs_mapping
 
-    unused_tokens = []
+    unused_tokens, unused_tags = [], []
 
-    skip_next_iterations = 0
-    for i, token in enumerate(tokens):
-        # If the previous argument was a keyword, then this is its value
-        if skip_next_iterations > 0:
-            skip_next_iterations -= 1
-            continue
+    n_tokens = len(tokens)
+    i = 0
+    while i < n_tokens:
+        token, tag = tokens[i], tags[i]
+        i += 1
 
-        if not token.startswith("-"):
+        if tag == _VALUE:
             unused_tokens.append(token)
+            unused_tags.append(tag)
             continue
 
-        cli_values = []
         kwargs_key = None
-        consume_count = 0
+        consume_all = False
 
         if "=" in token:
             cli_key, cli_value = token.split("=", 1)
-            cli_values.append(cli_value)
-            consume_count -= 1
+            cli_values = [cli_value]
         else:
             cli_key = token
+            cli_values = []
 
         try:
-            iparam, implicit_value = cli2kw[cli_key]
+            descriptor, implicit_factory = cli2descriptor[cli_key]
         except KeyError:
-            if kwargs_iparam:
-                iparam = kwargs_iparam
+            if kwargs_descriptor:
+                descriptor = kwargs_descriptor
                 kwargs_key = _cli_kw_to_f_kw(cli_key)
-                implicit_value = None
+                implicit_factory = None
             else:
                 unused_tokens.append(token)
+                unused_tags.append(tag)
                 continue
 
-        cparam = command.iparam_to_cparam[iparam]
+        iparam = descriptor.iparam
 
-        if implicit_value is not None:
+        if implicit_factory is not None:
+            implicit_value = implicit_factory()
             # A flag was parsed
             if cli_values:
                 # A value was parsed from "--key=value", and the ``value`` is in ``cli_values``.
-                if implicit_value:  # Only accept values to the positive flag
-                    pass
-                else:
+                if not implicit_value:  # Only accept values to the positive flag
                     raise CycloptsError(msg=f'Cannot assign value to negative flag "{cli_key}".')
             else:
                 cli_values.append(implicit_value)
-            tokens_per_element, consume_all = 0, False
         else:
-            tokens_per_element, consume_all = token_count(iparam)
-
-            with suppress(IndexError):
-                if consume_all:
-                    for j in itertools.count():
-                        token = tokens[i + 1 + j]
-                        if not cparam.allow_leading_hyphen and _is_option_like(token):
-                            break
-                        cli_values.append(token)
-                        skip_next_iterations += 1
-                else:
-                    consume_count += tokens_per_element
-                    for j in range(consume_count):
-                        token = tokens[i + 1 + j]
-                        if not cparam.allow_leading_hyphen:
-                            _validate_is_not_option_like(token)
-                        cli_values.append(token)
-                        skip_next_iterations += 1
+            tokens_per_element, consume_all = descriptor.token_count, descriptor.consume_all
+            if tokens_per_element is None:
+                token_count(descriptor.hint)  # Raises the appropriate error for the unsupported type.
+
+            if consume_all:
+                # Consume until the next option-like token.
+                stop = n_tokens
+                if not descriptor.allow_leading_hyphen:
+                    with suppress(ValueError):
+                        stop = tags.index(_OPTION, i)
+            else:
+                stop = min(n_tokens, i + max(0, tokens_per_element - len(cli_values)))
+                if not descriptor.allow_leading_hyphen:
+                    _validate_are_not_option_like(tokens, tags, i, stop)
+            cli_values.extend(tokens[i:stop])
+            i = stop
 
             if not cli_values or len(cli_values) % tokens_per_element:
                 raise MissingArgumentError(parameter=iparam, tokens_so_far=cli_values)
 
         # Update mapping
-        if iparam is kwargs_iparam:
+        if descriptor is kwargs_descriptor:
             assert kwargs_key is not None
-            if kwargs_key in mapping[iparam] and not consume_all:
+            if kwargs_key in kwargs_mapping and not consume_all:
                 raise RepeatArgumentError(parameter=iparam)
-            mapping[iparam].setdefault(kwargs_key, [])
-            mapping[iparam][kwargs_key].extend(cli_values)
+            kwargs_mapping.setdefault(kwargs_key, []).extend(cli_values)
         else:
-            if iparam in mapping and not consume_all:
+            values = mapping[descriptor.index]
+            if values is _UNSET:
+                mapping[descriptor.index] = cli_values
+            elif consume_all:
+                values.extend(cli_values)
+            else:
                 raise RepeatArgumentError(parameter=iparam)
 
-            mapping.setdefault(iparam, [])
-            mapping[iparam].extend(cli_values)
+    return unused_tokens, unused_tags
 
-    return unused_tokens
 
+# Token classifications; see ``_classify_token``.
+_VALUE = 0
+_OPTION = 1
+_NEGATIVE_NUMBER = 2
+
+
+def _classify_token(token: str) -> int:
+    """Classify a token as a plain value, an option-like token, or a negative number.
+
+    Equivalent to checking if ``complex(token)`` succeeds for tokens with a leading hyphen,
+    but only attempts the conversion if the token could plausibly be a number.
+    """
+    if not token.startswith("-"):
+        return _VALUE
+
+    second = token[1:2]
+    if second == "-" or (second.isascii() and second.isalpha() and second not in "iInNjJ"):
+        # Can't be a number; only "inf", "nan" and the imaginary "j" start with a letter.
+        return _OPTION
 
-def _is_option_like(token: str) -> bool:
     try:
         complex(token)
-        return False
     except ValueError:
-        pass
+        return _OPTION
+    return _NEGATIVE_NUMBER
 
-    if token.startswith("-"):
-        return True
 
-    return False
+def _classify_tokens(tokens: Iterable[str]) -> List[int]:
+    return [_classify_token(token) for token in tokens]
 
 
-def _validate_is_not_option_like(token):
-    if _is_option_like(token):
-        raise UnknownOptionError(token=token)
+def _validate_are_not_option_like(tokens: List[str], tags: List[int], start: int, stop: int):
+    try:
+        index = tags.index(_OPTION, start, stop)
+    except ValueError:
+        return
+    raise UnknownOptionError(token=tokens[index])
 
 
 def _parse_pos(
     command: ResolvedCommand,
-    tokens: Iterable[str],
-    mapping: ParameterDict,
+    tokens: List[str],
+    tags: List[int],
+    mapping: List[Any],
 ) -> List[str]:
-    tokens = list(tokens)
-
-    def remaining_parameters():
-        for iparam, cparam in command.iparam_to_cparam.items():
-            _, consume_all = token_count(iparam)
-            if iparam in mapping and not consume_all:
-                continue
-            if iparam.kind is iparam.KEYWORD_ONLY:  # pragma: no cover
-                # the kwargs parameter should always be in mapping.
-                break
-            yield iparam, cparam
+    """Assign ``tokens`` to the positional parameters not already populated by keyword.
 
-    for iparam, cparam in remaining_parameters():
-        if not tokens:
+    Returns
+    -------
+    List[str]
+        Remaining tokens that couldn't be assigned.
+    """
+    n_tokens = len(tokens)
+    i = 0
+    for descriptor in command.descriptors:
+        if i >= n_tokens:
             break
 
-        if iparam.kind is iparam.VAR_POSITIONAL:  # ``*args``
-            mapping.setdefault(iparam, [])
-            for token in tokens:
-                if not cparam.allow_leading_hyphen:
-                    _validate_is_not_option_like(token)
-
-                mapping[iparam].append(token)
-            tokens = []
+        iparam = descriptor.iparam
+        values = mapping[descriptor.index]
+        if values is not _UNSET and not descriptor.consume_all:
+            continue
+        if iparam.kind is iparam.KEYWORD_ONLY:  # pragma: no cover
+            # the kwargs parameter should always be in mapping.
             break
 
-        tokens_per_element, consume_all = token_count(iparam)
-
-        if consume_all:
-            # Prepend the positional values to the keyword values.
-            mapping.setdefault(iparam, [])
-            pos_tokens = []
-
-            for token in tokens:
-                if not cparam.allow_leading_hyphen:
-                    _validate_is_not_option_like(token)
-                pos_tokens.append(token)
-            mapping[iparam] = pos_tokens + mapping[iparam]
-            tokens = []
+        if iparam.kind is iparam.VAR_POSITIONAL or descriptor.consume_all:
+            # ``*args`` or an iterable; consumes all remaining tokens.
+            if not descriptor.allow_leading_hyphen:
+                _validate_are_not_option_like(tokens, tags, i, n_tokens)
+            # For iterables, prepend the positional values to the keyword values.
+            mapping[descriptor.index] = tokens[i:] if values is _UNSET else tokens[i:] + values
+            i = n_tokens
             break
 
-        tokens_per_element = max(1, tokens_per_element)
-
-        if len(tokens) < tokens_per_element:
-            raise MissingArgumentError(parameter=iparam, tokens_so_far=tokens)
+        tokens_per_element = descriptor.token_count
+        if tokens_per_element is None:
+            token_count(descriptor.hint)  # Raises the appropriate error for the unsupported type.
+        stop = i + max(1, tokens_per_element)
 
-        mapping.setdefault(iparam, [])
-        for token in tokens[:tokens_per_element]:
-            if not cparam.allow_leading_hyphen:
-                _validate_is_not_option_like(token)
+        if stop > n_tokens:
+            raise MissingArgumentError(parameter=iparam, tokens_so_far=tokens[i:])
 
-            mapping[iparam].append(token)
+        if not descriptor.allow_leading_hyphen:
+            _validate_are_not_option_like(tokens, tags, i, stop)
+        mapping[descriptor.index] = tokens[i:stop]
+        i = stop
 
-        tokens = tokens[tokens_per_element:]
+    return tokens[i:]
 
-    return tokens
 
-
-def _parse_env(command: ResolvedCommand, mapping):
+def _parse_env(command: ResolvedCommand, mapping: List[Any]):
     """Populate argument defaults from environment variables.
 
     In cyclopts, arguments are parsed with the following priority:
@@ -224,19 +405,18 @@ def _parse_env(command: ResolvedCommand, mapping):
     2. Values parsed from ``Parameter.env_var``.
     3. Default values from the function signature.
     """
-    for iparam, cparam in command.iparam_to_cparam.items():
-        if iparam in mapping:
+    for descriptor in command.descriptors:
+        if mapping[descriptor.index] is not _UNSET:
             # Don't check environment variables for already-parsed parameters.
             continue
 
-        for env_var_name in cparam.env_var:
+        for env_var_name in descriptor.cparam.env_var:
             try:
                 env_var_value = os.environ[env_var_name]
             except KeyError:
                 pass
             else:
-                mapping.setdefault(iparam, [])
-                mapping[iparam].append(env_var_value)
+                mapping[descriptor.index] = [env_var_value]
                 break
 
 
@@ -246,9 +426,9 @@ def _is_required(parameter: inspect.Parameter) -> bool:
 
 def _bind(
     command: ResolvedCommand,
-    mapping: ParameterDict,
+    coerced: List[Any],
 ):
-    """Bind the mapping to the function signature.
+    """Bind the coerced values to the function signature.
 
     Better than directly using ``signature.bind`` because this can handle
     intermingled keywords.
@@ -256,68 +436,64 @@ def _bind(
     f_pos, f_kwargs = [], {}
     use_pos = True
 
-    def f_pos_append(p):
-        nonlocal use_pos
-        assert use_pos
-        try:
-            f_pos.append(mapping[p])
-        except KeyError:
-            if _is_required(p):
-                raise MissingArgumentError(parameter=p, tokens_so_far=[]) from None
-            use_pos = False
-
-    for iparam in command.iparam_to_cparam.keys():
+    for descriptor, value in zip(command.descriptors, coerced):
+        iparam = descriptor.iparam
         if use_pos and iparam.kind in (iparam.POSITIONAL_ONLY, iparam.POSITIONAL_OR_KEYWORD):
-            f_pos_append(iparam)
+            if value is not _UNSET:
+                f_pos.append(value)
+            elif _is_required(iparam):
+                raise MissingArgumentError(parameter=iparam, tokens_so_far=[])
+            else:
+                use_pos = False
         elif use_pos and iparam.kind is iparam.VAR_POSITIONAL:  # ``*args``
-            f_pos.extend(mapping.get(iparam, []))
+            if value is not _UNSET:
+                f_pos.extend(value)
             use_pos = False
         elif iparam.kind is iparam.VAR_KEYWORD:
-            f_kwargs.update(mapping.get(iparam, {}))
-        else:
-            try:
-                f_kwargs[iparam.name] = mapping[iparam]
-            except KeyError:
-                if _is_required(iparam):
-                    raise MissingArgumentError(parameter=iparam, tokens_so_far=[]) from None
+            if value is not _UNSET:
+                f_kwargs.update(value)
+        elif value is not _UNSET:
+            f_kwargs[iparam.name] = value
+        elif _is_required(iparam):
+            raise MissingArgumentError(parameter=iparam, tokens_so_far=[])
 
     bound = command.bind(*f_pos, **f_kwargs)
     return bound
 
 
-def _convert(command: ResolvedCommand, mapping: ParameterDict) -> ParameterDict:
-    coerced = ParameterDict()
-    for iparam, parameter_tokens in mapping.items():
-        cparam = command.iparam_to_cparam[iparam]
-        type_ = get_hint_parameter(iparam)[0]
+def _convert(command: ResolvedCommand, mapping: List[Any]) -> List[Any]:
+    coerced = [_UNSET] * len(mapping)
+    for descriptor, parameter_tokens in zip(command.descriptors, mapping):
+        if parameter_tokens is _UNSET:
+            continue
+
+        iparam, cparam, type_ = descriptor.iparam, descriptor.cparam, descriptor.hint
 
         # Checking if parameter_token is a string is a little jank,
         # but works for all current use-cases.
         for parameter_token in parameter_tokens:
             if not isinstance(parameter_token, str):
                 # A token would be non-string if it's the implied-value (from a flag).
-                coerced[iparam] = parameter_tokens[0]
+                coerced[descriptor.index] = parameter_tokens[0]
                 break
         else:
             try:
                 if iparam.kind == iparam.VAR_KEYWORD:
-                    coerced[iparam] = {}
+                    val = {}
                     for key, values in parameter_tokens.items():
-                        val = cparam.converter(type_, *values)
+                        val[key] = element = descriptor.converter(*values)
                         for validator in cparam.validator:
-                            validator(type_, val)
-                        coerced[iparam][key] = val
+                            validator(type_, element)
                 elif iparam.kind == iparam.VAR_POSITIONAL:
-                    val = cparam.converter(List[type_], *parameter_tokens)
+                    val = descriptor.converter(*parameter_tokens)
                     for validator in cparam.validator:
                         for v in val:
                             validator(type_, v)
-                    coerced[iparam] = val
                 else:
-                    val = cparam.converter(type_, *parameter_tokens)
+                    val = descriptor.converter(*parameter_tokens)
                     for validator in cparam.validator:
                         validator(type_, val)
-                    coerced[iparam] = val
+                coerced[descriptor.index] = val
             except CoercionError as e:
                 e.parameter = iparam
                 raise
@@ -347,15 +523,13 @@ def create_bound_arguments(
         Remaining tokens that couldn't be matched to ``f``'s signature.
     """
     # Note: mapping is updated inplace
-    mapping = ParameterDict()  # Each value should be a list
+    mapping = [_UNSET] * len(command.descriptors)  # Each populated slot should be a list
     unused_tokens = []
 
-    validate_command(command.command)
-
     try:
-        # Build up a mapping of inspect.Parameter->List[str]
-        unused_tokens = _parse_kw_and_flags(command, tokens, mapping)
-        unused_tokens = _parse_pos(command, unused_tokens, mapping)
+        # Build up a mapping of parameter slot->List[str]
+        unused_tokens, unused_tags = _parse_kw_and_flags(command, tokens, _classify_tokens(tokens), mapping)
+        unused_tokens = _parse_pos(command, unused_tokens, unused_tags, mapping)
         _parse_env(command, mapping)
 
         # For each parameter, convert the list of string tokens.
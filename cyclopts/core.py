@@ -1,11 +1,13 @@
+import importlib
 import inspect
 import os
 import sys
 import traceback
 from contextlib import suppress
 from copy import copy
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Callable,
@@ -14,16 +16,18 @@ from typing import (
     Iterator,
     List,
     Literal,
+    Mapping,
     Optional,
     Tuple,
     TypeVar,
     Union,
 )
 
-from attrs import define, field
+from attrs import define, field, frozen, setters
 
+import cyclopts.group
 import cyclopts.utils
-from cyclopts.bind import create_bound_arguments, normalize_tokens
+from cyclopts.bind import create_bound_arguments, expand_response_files, normalize_tokens
 from cyclopts.exceptions import (
     CommandCollisionError,
     CycloptsError,
@@ -33,15 +37,7 @@ from cyclopts.exceptions import (
     format_cyclopts_error,
 )
 from cyclopts.group import Group, GroupConverter, sort_groups
-from cyclopts.group_extractors import groups_from_app, inverse_groups_from_app
-from cyclopts.help import (
-    HelpPanel,
-    create_parameter_help_panel,
-    format_command_entries,
-    format_doc,
-    format_usage,
-    resolve_help_format,
-)
+from cyclopts.group_extractors import groups_from_app
 from cyclopts.parameter import Parameter, validate_command
 from cyclopts.protocols import Dispatcher
 from cyclopts.resolve import ResolvedCommand
@@ -60,43 +56,48 @@ if sys.version_info < (3, 9):
 else:
     from typing import Annotated
 
-
-with suppress(ImportError):
-    # By importing, makes things like the arrow-keys work.
-    import readline  # Not available on windows
-
 if TYPE_CHECKING:
     from rich.console import Console
 
+    from cyclopts.help import HelpPanel
+
 
 class _CannotDeriveCallingModuleNameError(Exception):
     pass
 
 
+# Frames of these packages are skipped; ``attr`` covers the attrs-generated ``App`` methods.
+_internal_root_module_names = {"cyclopts", "attr"}
+
+
 def _get_root_module_name():
     """Get the calling package name from the call-stack."""
-    for elem in inspect.stack():
-        module = inspect.getmodule(elem.frame)
+    # Walk the frames directly; ``inspect.stack()`` also reads source context for every frame.
+    frame = inspect.currentframe()
+    while frame is not None:
+        module = inspect.getmodule(frame)
+        frame = frame.f_back
         if module is None:
             continue
         root_module_name = module.__name__.split(".")[0]
-        if root_module_name == "cyclopts":
+        if root_module_name in _internal_root_module_names:
             continue
         return root_module_name
 
     raise _CannotDeriveCallingModuleNameError  # pragma: no cover
 
 
-def _default_version(default="0.0.0") -> str:
-    """Attempts to get the calling code's version.
+@lru_cache(maxsize=None)
+def _default_version(root_module_name: Optional[str], default="0.0.0") -> str:
+    """Attempts to get the version of package ``root_module_name``.
+
+    Memoized, as querying package metadata is relatively expensive.
 
     Returns
     -------
     version: str
         ``default`` if it cannot determine version.
     """
-    import importlib
-
     if sys.version_info < (3, 10):  # pragma: no cover
         from importlib_metadata import PackageNotFoundError
         from importlib_metadata import version as importlib_metadata_version
@@ -104,9 +105,7 @@ def _default_version(default="0.0.0") -> str:
         from importlib.metadata import PackageNotFoundError
         from importlib.metadata import version as importlib_metadata_version
 
-    try:
-        root_module_name = _get_root_module_name()
-    except _CannotDeriveCallingModuleNameError:  # pragma: no cover
+    if root_module_name is None:  # pragma: no cover
         return default
 
     # Attempt to get the Distribution Package’s version number.
@@ -134,17 +133,58 @@ def _validate_default_command(x):
     return x
 
 
-def _combined_meta_command_mapping(app):
-    """Return a copied and combined mapping containing app and meta-app commands."""
-    command_mapping = copy(app._commands)
-    while (app := app._meta) and app._commands:
-        command_mapping.update(app._commands)
-    return command_mapping
+def _import_path_name(import_path: str) -> str:
+    """Get the object name from a ``"package.module:function"`` import path without importing it."""
+    module_name, _, attribute = import_path.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f'Command import path "{import_path}" must be of the form "package.module:function".')
+    return attribute.rsplit(".", 1)[-1]
+
+
+def _import_command(import_path: str) -> Callable:
+    """Import the object referenced by a ``"package.module:function"`` import path."""
+    module_name, _, attribute = import_path.partition(":")
+    obj = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _invalidate_cache_on_setattr(instance, attribute, value):
+    instance._invalidate_cache()
+    return value
+
+
+# Fields that influence command resolution; assigning to them clears cached ``ResolvedCommand``.
+_invalidating_on_setattr = [setters.convert, setters.validate, _invalidate_cache_on_setattr]
+
+
+def _combined_meta_command_mapping(app) -> Mapping[str, "App"]:
+    """Return a read-only combined mapping containing app and meta-app commands.
+
+    The mapping is cached on ``app`` until a command is registered/deleted or a meta-app is attached.
+    """
+    if app._command_table is None:
+        command_mapping = copy(app._commands)
+        meta = app
+        while (meta := meta._meta) and meta._commands:
+            command_mapping.update(meta._commands)
+        app._command_table = MappingProxyType(command_mapping)
+    return app._command_table
 
 
 def _get_command_groups(parent_app, child_app):
     """Extract out the command groups from the ``parent_app`` for a given ``child_app``."""
-    return next(x for x in inverse_groups_from_app(parent_app) if x[0] is child_app)[1]
+    if not child_app.show:
+        return []
+    elif not child_app.group:
+        # Fast-path; avoids inspecting all sibling commands.
+        return [parent_app.group_commands]
+    return [
+        group
+        for group, apps in groups_from_app(parent_app, promote_commands=False)
+        if any(app is child_app for app in apps)
+    ]
 
 
 def resolve_default_parameter_from_apps(apps) -> Parameter:
@@ -165,6 +205,121 @@ def resolve_default_parameter_from_apps(apps) -> Parameter:
     return Parameter.combine(*cparams)
 
 
+@frozen
+class _Route:
+    """Result of routing CLI tokens through the command tree.
+
+    Computed once per invocation and shared by parsing, console resolution and help rendering.
+    """
+
+    command_chain: List[str]
+    """Tokens that are interpreted as a valid command chain."""
+
+    apps: List["App"]
+    """The associated :class:`App` object with each of those tokens (prepended with the root app)."""
+
+    unused_tokens: List[str]
+    """The remaining non-command tokens."""
+
+
+# ``App.command`` keyword arguments that a ``_CommandEntry`` can represent without creating an ``App``.
+# ``help_flags`` and ``version_flags`` must be empty.
+_command_entry_kwargs = frozenset({"help", "group", "show", "help_flags", "version_flags"})
+
+
+class _CommandEntry:
+    """Compact stand-in for a function registered with :meth:`App.command`.
+
+    Holds just enough to route to and list the command (e.g. on a help-page).
+    It is promoted to a full :class:`App` when routed to, or when accessed via ``app[name]``
+    (e.g. to be configured).
+    """
+
+    __slots__ = (
+        "command",
+        "parent",
+        "explicit_name",
+        "name_transform",
+        "group_commands",
+        "group_arguments",
+        "group_parameters",
+        "kwargs",
+        "app",
+    )
+
+    def __init__(self, command: Union[str, Callable], parent: "App", explicit_name, kwargs: dict):
+        self.command = command
+        self.parent = parent
+        self.explicit_name = explicit_name
+        self.name_transform = parent.name_transform
+        # Same as the group copies made by ``App.command``, but only copied once promoted.
+        self.group_commands = parent.group_commands
+        self.group_arguments = parent.group_arguments
+        self.group_parameters = parent.group_parameters
+        self.kwargs = kwargs
+        self.app: Optional["App"] = None  # Set once promoted.
+
+    @property
+    def name(self) -> Tuple[str, ...]:
+        if self.explicit_name is not None:
+            return to_tuple_converter(self.explicit_name)
+        elif isinstance(self.command, str):
+            return (self.name_transform(_import_path_name(self.command)),)
+        else:
+            return (self.name_transform(self.command.__name__),)
+
+    @property
+    def help(self) -> str:
+        help = self.kwargs.get("help")
+        if help is not None:
+            return help
+        elif isinstance(self.command, str) or self.command.__doc__ is None:
+            return ""
+        else:
+            return self.command.__doc__
+
+    @property
+    def show(self) -> bool:
+        return self.kwargs.get("show", True)
+
+    @property
+    def group(self) -> Tuple[Union[Group, str], ...]:
+        return to_tuple_converter(self.kwargs.get("group"))
+
+    def promote(self) -> "App":
+        """Replace this entry in its parent with the equivalent :class:`App`.
+
+        Idempotent; stale references (e.g. in a cached command table) resolve to the same :class:`App`.
+        """
+        if self.app is not None:
+            return self.app
+
+        app = self.app = App(
+            default_command=self.command,
+            help_flags=[],
+            version_flags=[],
+            group_commands=copy(self.group_commands),
+            group_arguments=copy(self.group_arguments),
+            group_parameters=copy(self.group_parameters),
+            **self.kwargs,
+        )
+        if app._name_transform is None:
+            app.name_transform = self.name_transform
+        if self.explicit_name is not None:
+            app._name = self.explicit_name
+        app._parents.append(self.parent)
+
+        commands = self.parent._commands
+        for name, entry in commands.items():
+            if entry is self:
+                commands[name] = app
+        return app
+
+
+def _promote(app: Union["App", _CommandEntry]) -> "App":
+    return app.promote() if type(app) is _CommandEntry else app  # pyright: ignore[reportReturnType]
+
+
 def walk_metas(app):
     # Iterates from deepest to shallowest meta-apps
     meta_list = [app]  # shallowest to deepest
@@ -186,10 +341,21 @@ class App:
 
     # Everything below must be kw_only
 
-    default_command: Optional[Callable] = field(default=None, converter=_validate_default_command, kw_only=True)
-    default_parameter: Optional[Parameter] = field(default=None, kw_only=True)
+    # Either a Callable, or a lazily-imported "package.module:function" string.
+    _default_command: Union[None, str, Callable] = field(
+        default=None,
+        alias="default_command",
+        converter=_validate_default_command,
+        kw_only=True,
+        on_setattr=_invalidating_on_setattr,
+    )
+    default_parameter: Optional[Parameter] = field(
+        default=None,
+        kw_only=True,
+        on_setattr=_invalidating_on_setattr,
+    )
 
-    version: Union[None, str, Callable] = field(factory=_default_version, kw_only=True)
+    _version: Union[None, str, Callable] = field(default=None, alias="version", kw_only=True)
     # This can ONLY ever be a Tuple[str, ...]
     _version_flags: Union[str, Iterable[str]] = field(
         default=["--version"],
@@ -200,6 +366,9 @@ class App:
 
     show: bool = field(default=True, kw_only=True)
 
+    response_files: bool = field(default=False, kw_only=True)
+    response_file_max_depth: int = field(default=8, kw_only=True)
+
     console: Optional["Console"] = field(default=None, kw_only=True)
 
     # This can ONLY ever be a Tuple[str, ...]
@@ -220,26 +389,36 @@ class App:
         ]
     ] = field(default=None, kw_only=True)
 
+    renderer: Optional[Literal["auto", "plaintext", "rich"]] = field(default=None, kw_only=True)
+
+    help_cache_dir: Union[None, str, Path] = field(default=None, kw_only=True)
+
     # This can ONLY ever be Tuple[Union[Group, str], ...] due to converter.
     # The other types is to make mypy happy for Cyclopts users.
     group: Union[Group, str, Tuple[Union[Group, str], ...]] = field(
-        default=None, converter=to_tuple_converter, kw_only=True
+        default=None,
+        converter=to_tuple_converter,
+        kw_only=True,
+        on_setattr=_invalidating_on_setattr,
     )
 
     group_arguments: Group = field(
         default=None,
         converter=GroupConverter(Group.create_default_arguments()),
         kw_only=True,
+        on_setattr=_invalidating_on_setattr,
     )
     group_parameters: Group = field(
         default=None,
         converter=GroupConverter(Group.create_default_parameters()),
         kw_only=True,
+        on_setattr=_invalidating_on_setattr,
     )
     group_commands: Group = field(
         default=None,
         converter=GroupConverter(Group.create_default_commands()),
         kw_only=True,
+        on_setattr=_invalidating_on_setattr,
     )
 
     converter: Optional[Callable] = field(default=None, kw_only=True)
@@ -255,14 +434,31 @@ class App:
     # Private Attributes #
     ######################
     # Maps CLI-name of a command to a function handle.
-    _commands: Dict[str, "App"] = field(init=False, factory=dict)
+    # Functions are registered as a ``_CommandEntry``, until promoted to an ``App``.
+    _commands: Dict[str, Union["App", _CommandEntry]] = field(init=False, factory=dict)
 
     _parents: List["App"] = field(init=False, factory=list)
 
     _meta: "App" = field(init=False, default=None)
     _meta_parent: "App" = field(init=False, default=None)
 
+    # Root module name of the code that instantiated this app; used to derive a default version.
+    _version_module: Optional[str] = field(init=False, default=None, eq=False)
+
+    # Cached result of ``_combined_meta_command_mapping``.
+    _command_table: Optional[Mapping[str, "App"]] = field(init=False, default=None, eq=False)
+
+    # Maps a traversed command chain (by app identity) to its ``ResolvedCommand``.
+    _resolved_commands: Dict[Tuple, ResolvedCommand] = field(init=False, factory=dict, eq=False)
+    # Value of ``cyclopts.group._mutation_count`` when ``_resolved_commands`` was last valid.
+    _resolved_commands_group_mutations: int = field(init=False, default=0, eq=False)
+
     def __attrs_post_init__(self):
+        if self._version is None:
+            # Cheap frame walk; the package's version is only looked up when ``version`` is read.
+            with suppress(_CannotDeriveCallingModuleNameError):
+                self._version_module = _get_root_module_name()
+
         # Trigger the setters
         self.help_flags = self._help_flags
         self.version_flags = self._version_flags
@@ -270,6 +466,31 @@ class App:
     ###########
     # Methods #
     ###########
+    def _invalidate_cache(self):
+        """Clear cached command resolutions of this app and all apps that may route to it."""
+        stack, seen = [self], set()
+        while stack:
+            app = stack.pop()
+            if id(app) in seen:
+                continue
+            seen.add(id(app))
+            app._resolved_commands.clear()
+            stack.extend(app._parents)
+            if app._meta_parent is not None:
+                stack.append(app._meta_parent)
+
+    def _promote_commands(self):
+        """Promote all registered ``_CommandEntry`` to full :class:`App` objects."""
+        for entry in list(self._commands.values()):
+            _promote(entry)
+
+    def _invalidate_command_table(self):
+        """Clear the combined command mapping of this app and every app that it is a meta-app of."""
+        app = self
+        while app is not None:
+            app._command_table = None
+            app = app._meta_parent
+
     def _delete_commands(self, commands: Iterable[str], default=None):
         """Safely delete commands.
 
@@ -323,33 +544,54 @@ class App:
                 help="Display this message and exit.",
             )
 
+    @property
+    def default_command(self) -> Optional[Callable]:
+        """Function handler; a lazily registered command gets imported on first access."""
+        self._import_default_command()
+        return self._default_command  # pyright: ignore[reportReturnType]
+
+    @default_command.setter
+    def default_command(self, value):
+        self._default_command = value
+
+    def _import_default_command(self):
+        if isinstance(self._default_command, str):
+            command = _import_command(self._default_command)
+            validate_command(command)
+            self._default_command = command
+
     @property
     def name(self) -> Tuple[str, ...]:
         """Application name(s). Dynamically derived if not previously set."""
         if self._name:
             return self._name  # pyright: ignore[reportReturnType]
-        elif self.default_command is None:
+        elif self._default_command is None:
             name = Path(sys.argv[0]).name
             if name == "__main__.py":
                 name = _get_root_module_name()
             return (name,)
+        elif isinstance(self._default_command, str):
+            return (self.name_transform(_import_path_name(self._default_command)),)
         else:
-            return (self.name_transform(self.default_command.__name__),)
+            return (self.name_transform(self._default_command.__name__),)
 
     @property
     def help(self) -> str:
         if self._help is not None:
             return self._help
-        elif self.default_command is None:
+        elif self._default_command is None:
             # Try and fallback to a meta-app docstring.
             if self._meta is None:
                 return ""
             else:
                 return self.meta.help
-        elif self.default_command.__doc__ is None:
+        elif isinstance(self._default_command, str):
+            # Don't import a lazily registered command just for its docstring.
+            return ""
+        elif self._default_command.__doc__ is None:
             return ""
         else:
-            return self.default_command.__doc__
+            return self._default_command.__doc__
 
     @help.setter
     def help(self, value):
@@ -363,9 +605,20 @@ class App:
     def name_transform(self, value):
         self._name_transform = value
 
+    @property
+    def version(self) -> Union[str, Callable]:
+        if self._version is None:
+            return _default_version(self._version_module)
+        return self._version
+
+    @version.setter
+    def version(self, value):
+        self._version = value
+
     def version_print(self) -> None:
         """Print the application version."""
-        print(self.version() if callable(self.version) else self.version)
+        version = self.version
+        print(version() if callable(version) else version)
 
     def __getitem__(self, key: str) -> "App":
         """Get the subapp from a command string.
@@ -376,10 +629,12 @@ class App:
         if self._meta:
             with suppress(KeyError):
                 return self.meta[key]
-        return self._commands[key]
+        return _promote(self._commands[key])
 
     def __delitem__(self, key: str):
         del self._commands[key]
+        self._invalidate_command_table()
+        self._invalidate_cache()
 
     def __contains__(self, k: str) -> bool:
         if k in self._commands:
@@ -407,6 +662,8 @@ class App:
                 group_parameters=copy(self.group_parameters),
             )
             self._meta._meta_parent = self
+            self._invalidate_command_table()
+            self._invalidate_cache()
         return self._meta
 
     def parse_commands(self, tokens: Union[None, str, Iterable[str]] = None):
@@ -427,6 +684,10 @@ class App:
         List[str]
             The remaining non-command tokens.
         """
+        route = self._route(tokens)
+        return route.command_chain, route.apps, route.unused_tokens
+
+    def _route(self, tokens: Union[None, str, Iterable[str]] = None) -> _Route:
         tokens = normalize_tokens(tokens)
 
         command_chain = []
@@ -438,15 +699,16 @@ class App:
 
         for i, token in enumerate(tokens):
             try:
-                app = command_mapping[token]
+                app = _promote(command_mapping[token])
                 apps.append(app)
                 unused_tokens = tokens[i + 1 :]
             except KeyError:
                 break
+            app._import_default_command()
             command_chain.append(token)
             command_mapping = _combined_meta_command_mapping(app)
 
-        return command_chain, apps, unused_tokens
+        return _Route(command_chain, apps, unused_tokens)
 
     def command(
         self,
@@ -458,8 +720,10 @@ class App:
 
         Parameters
         ----------
-        obj: Optional[Callable]
+        obj: Union[None, str, Callable, App]
             Function or :class:`App` to be registered as a command.
+            May also be an import path string ``"package.module:function"``;
+            the module will only be imported once the command is invoked or its help-page is displayed.
         name: Union[None, str, Iterable[str]]
             Name(s) to register the ``obj`` to.
             If not provided, defaults to:
@@ -481,9 +745,18 @@ class App:
             if kwargs:
                 raise ValueError("Cannot supplied additional configuration when registering a sub-App.")
         else:
-            validate_command(obj)
+            if isinstance(obj, str):
+                _import_path_name(obj)  # Validates import-path format.
+            else:
+                validate_command(obj)
             kwargs.setdefault("help_flags", [])
             kwargs.setdefault("version_flags", [])
+
+            if not kwargs["help_flags"] and not kwargs["version_flags"] and _command_entry_kwargs.issuperset(kwargs):
+                # Defer creating the ``App`` until it's actually needed.
+                del kwargs["help_flags"], kwargs["version_flags"]
+                return self._register_command(_CommandEntry(obj, self, name, kwargs), name)
+
             if "group_commands" not in kwargs:
                 kwargs["group_commands"] = copy(self.group_commands)
             if "group_parameters" not in kwargs:
@@ -496,10 +769,15 @@ class App:
         if app._name_transform is None:
             app.name_transform = self.name_transform
 
+        if name is not None:
+            app._name = name
+
+        app._parents.append(self)
+        return self._register_command(app, name, obj)
+
+    def _register_command(self, app: Union["App", _CommandEntry], name, obj=None):
         if name is None:
             name = app.name
-        else:
-            app._name = name
 
         for n in to_tuple_converter(name):
             if n in self:
@@ -508,9 +786,10 @@ class App:
             # Warning: app._name may not align with command name
             self._commands[n] = app
 
-        app._parents.append(self)
+        self._invalidate_command_table()
+        self._invalidate_cache()
 
-        return obj  # pyright: ignore[reportReturnType]
+        return app.command if obj is None else obj
 
     def default(
         self,
@@ -562,18 +841,22 @@ class App:
         unused_tokens: List[str]
             Any remaining CLI tokens that didn't get parsed for ``command``.
         """
+        command, bound, unused_tokens, _ = self._parse_known_args(tokens, console=console)
+        return command, bound, unused_tokens
+
+    def _parse_known_args(
+        self,
+        tokens: Union[None, str, Iterable[str]] = None,
+        *,
+        console: Optional["Console"] = None,
+    ) -> Tuple[Callable, inspect.BoundArguments, List[str], _Route]:
+        """Implementation of :meth:`parse_known_args` that additionally returns the computed route."""
         tokens = normalize_tokens(tokens)
+        if self.response_files:
+            tokens = expand_response_files(tokens, max_depth=self.response_file_max_depth)
 
         meta_parent = self
 
-        command_chain, apps, unused_tokens = self.parse_commands(tokens)
-        command_app = apps[-1]
-
-        try:
-            parent_app = apps[-2]
-        except IndexError:
-            parent_app = None
-
         # Special flags (help/version) get intercepted by the root app.
         # Special flags are allows to be **anywhere** in the token stream.
 
@@ -588,10 +871,25 @@ class App:
 
         if help_flag_index is not None:
             tokens.pop(help_flag_index)
-            command = self.help_print
-            while meta_parent := meta_parent._meta_parent:
-                command = meta_parent.help_print
-            bound = cyclopts.utils.signature(command).bind(tokens, console=console)
+            # The help-page is printed by the outermost meta-app, so route from there.
+            help_app = self
+            while help_app._meta_parent:
+                help_app = help_app._meta_parent
+            route = help_app._route(tokens)
+        else:
+            route = self._route(tokens)
+
+        command_chain, apps, unused_tokens = route.command_chain, route.apps, route.unused_tokens
+        command_app = apps[-1]
+
+        try:
+            parent_app = apps[-2]
+        except IndexError:
+            parent_app = None
+
+        if help_flag_index is not None:
+            command = help_app.help_print  # pyright: ignore[reportPossiblyUnboundVariable]
+            bound = cyclopts.utils.signature(command).bind(tokens, console=console, _route=route)
             unused_tokens = []
         elif any(flag in tokens for flag in self.version_flags):
             # Version
@@ -605,7 +903,7 @@ class App:
                 if command_app.default_command:
                     command = command_app.default_command
                     resolved_command = self._resolve_command(
-                        tokens,
+                        route,
                         parse_docstring=False,
                     )
                     # We want the resolved group that ``app`` belongs to.
@@ -639,17 +937,17 @@ class App:
                         # Running the application with no arguments and no registered
                         # ``default_command`` will default to ``help_print``.
                         command = self.help_print
-                        bound = cyclopts.utils.signature(command).bind(tokens=tokens, console=console)
+                        bound = cyclopts.utils.signature(command).bind(tokens=tokens, console=console, _route=route)
                         unused_tokens = []
             except CycloptsError as e:
                 e.app = command_app
                 if command_chain:
                     e.command_chain = command_chain
                 if e.console is None:
-                    e.console = self._resolve_console(tokens, console)
+                    e.console = self._resolve_console(route, console)
                 raise
 
-        return command, bound, unused_tokens
+        return command, bound, unused_tokens, route
 
     def parse_args(
         self,
@@ -694,11 +992,31 @@ class App:
         bound: inspect.BoundArguments
             Parsed and converted ``args`` and ``kwargs`` to be used when calling ``command``.
         """
+        command, bound, _ = self._parse_args(
+            tokens,
+            console=console,
+            print_error=print_error,
+            exit_on_error=exit_on_error,
+            verbose=verbose,
+        )
+        return command, bound
+
+    def _parse_args(
+        self,
+        tokens: Union[None, str, Iterable[str]] = None,
+        *,
+        console: Optional["Console"] = None,
+        print_error: bool = True,
+        exit_on_error: bool = True,
+        verbose: bool = False,
+    ) -> Tuple[Callable, inspect.BoundArguments, _Route]:
+        """Implementation of :meth:`parse_args` that additionally returns the computed route."""
         tokens = normalize_tokens(tokens)
 
         # Normal parsing
+        route = None
         try:
-            command, bound, unused_tokens = self.parse_known_args(tokens, console=console)
+            command, bound, unused_tokens, route = self._parse_known_args(tokens, console=console)
             if unused_tokens:
                 raise UnusedCliTokensError(
                     target=command,
@@ -709,7 +1027,8 @@ class App:
             e.root_input_tokens = tokens
 
             if e.console is None:
-                e.console = self._resolve_console(tokens, console)
+                # Errors raised before routing (e.g. response-file expansion) only consider the root app.
+                e.console = self._resolve_console(route or _Route([], [self], tokens), console)
             if print_error:
                 assert e.console
                 e.console.print(format_cyclopts_error(e))
@@ -717,7 +1036,7 @@ class App:
                 sys.exit(1)
             raise
 
-        return command, bound
+        return command, bound, route
 
     def __call__(
         self,
@@ -754,8 +1073,7 @@ class App:
         return_value: Any
             The value the parsed command handler returns.
         """
-        tokens = normalize_tokens(tokens)
-        command, bound = self.parse_args(
+        command, bound, route = self._parse_args(
             tokens,
             console=console,
             print_error=print_error,
@@ -777,7 +1095,7 @@ class App:
 
             if PydanticValidationError is not None and isinstance(e, PydanticValidationError):
                 if print_error:
-                    console = self._resolve_console(tokens, console)
+                    console = self._resolve_console(route, console)
                     console.print(format_cyclopts_error(e))
 
                 if exit_on_error:
@@ -785,14 +1103,39 @@ class App:
             raise
 
     def _resolve_console(
-        self, tokens: Union[None, str, Iterable[str]], console: Optional["Console"] = None
+        self,
+        route: _Route,
+        console: Optional["Console"] = None,
+        *,
+        for_help: bool = False,
     ) -> "Console":
         if console is not None:
             return console
-        _, apps, _ = self.parse_commands(tokens)
-        for app in reversed(apps):
+        for app in reversed(route.apps):
             if app.console:
                 return app.console
+
+        # Resolve renderer; None fallsback to parent; non-None overwrites parent.
+        renderer = "auto"
+        for app in route.apps:
+            if app.renderer is not None:
+                renderer = app.renderer
+
+        if renderer == "auto":
+            if for_help:
+                from cyclopts.help import resolve_help_format
+
+                plaintext = resolve_help_format(route.apps) == "plaintext"
+            else:
+                plaintext = not (sys.stdout and sys.stdout.isatty())
+        else:
+            plaintext = renderer == "plaintext"
+
+        if plaintext:
+            from cyclopts._plaintext import PlaintextConsole
+
+            return PlaintextConsole()  # pyright: ignore[reportReturnType]
+
         from rich.console import Console
 
         return Console()
@@ -802,6 +1145,7 @@ class App:
         tokens: Annotated[Union[None, str, Iterable[str]], Parameter(show=False)] = None,
         *,
         console: Annotated[Optional["Console"], Parameter(parse=False)] = None,
+        _route: Annotated[Optional[_Route], Parameter(parse=False)] = None,
     ) -> None:
         """Print the help page.
 
@@ -814,13 +1158,38 @@ class App:
             Console to print help and runtime Cyclopts errors.
             If not provided, follows the resolution order defined in :attr:`App.console`.
         """
-        tokens = normalize_tokens(tokens)
-
-        command_chain, apps, _ = self.parse_commands(tokens)
+        # Parsing passes along the route that it already computed for ``tokens``.
+        route = self._route(tokens) if _route is None else _route
+        console = self._resolve_console(route, console, for_help=True)
+
+        # Resolve help_cache_dir; None fallsback to parent; non-None overwrites parent.
+        help_cache_dir = None
+        for app in route.apps:
+            if app.help_cache_dir is not None:
+                help_cache_dir = app.help_cache_dir
+
+        if help_cache_dir is None:
+            self._render_help(route, console)
+            return
+
+        from cyclopts import _help_cache
+
+        key = _help_cache.fingerprint(route.apps, list(walk_metas(route.apps[-1])), route.command_chain, console)
+        text = _help_cache.load(help_cache_dir, key)
+        if text is None:
+            with _help_cache.capture(console) as capture:
+                self._render_help(route, console)
+            text = capture.get()
+            _help_cache.store(help_cache_dir, key, text)
+        _help_cache.replay(console, text)
+
+    def _render_help(self, route: _Route, console: "Console") -> None:
+        from cyclopts._plaintext import PlaintextConsole
+        from cyclopts.help import format_doc, format_usage, resolve_help_format
+
+        command_chain, apps = route.command_chain, route.apps
         executing_app = apps[-1]
 
-        console = self._resolve_console(tokens, console)
-
         # Print the:
         #    my-app command COMMAND [ARGS] [OPTIONS]
         if executing_app.usage is None:
@@ -829,22 +1198,38 @@ class App:
             console.print(executing_app.usage + "\n")
 
         # Print the App/Command's Doc String.
-        help_format = resolve_help_format(apps)
+        # The plaintext console cannot render markup, so the docstrings are displayed as-is.
+        help_format = "plaintext" if isinstance(console, PlaintextConsole) else resolve_help_format(apps)
         console.print(format_doc(self, executing_app, help_format))
 
-        for help_panel in self._assemble_help_panels(tokens, help_format):
+        for help_panel in self._assemble_help_panels(route, help_format):
             console.print(help_panel)
 
     def _resolve_command(
         self,
-        tokens: Union[None, str, Iterable[str]] = None,
+        route: _Route,
         parse_docstring: bool = True,
     ) -> ResolvedCommand:
-        _, apps, _ = self.parse_commands(tokens)
+        apps = route.apps
 
         if not apps[-1].default_command:
             raise InvalidCommandError
 
+        if self._resolved_commands_group_mutations != cyclopts.group._mutation_count:
+            # A (possibly shared) ``Group`` was modified in-place.
+            self._resolved_commands.clear()
+            self._resolved_commands_group_mutations = cyclopts.group._mutation_count
+
+        key = (tuple(id(app) for app in apps), parse_docstring)
+        try:
+            return self._resolved_commands[key]
+        except KeyError:
+            pass
+
+        # Only validated when building a new (cached) ResolvedCommand, not on every parse.
+        # Usually redundant with the validation in ``App.command`` and ``App.default``,
+        # but ``default_command`` may also be directly assigned.
+        validate_command(apps[-1].default_command)
         resolved_command = ResolvedCommand(
             apps[-1].default_command,
             resolve_default_parameter_from_apps(apps),
@@ -852,26 +1237,30 @@ class App:
             apps[-1].group_parameters,
             parse_docstring=parse_docstring,
         )
+        self._resolved_commands[key] = resolved_command
         return resolved_command
 
     def _assemble_help_panels(
         self,
-        tokens: Union[None, str, Iterable[str]],
+        route: _Route,
         help_format,
-    ) -> List[HelpPanel]:
-        from rich.console import Group as RichGroup
-        from rich.console import NewLine
-
-        _, apps, _ = self.parse_commands(tokens)
+    ) -> List["HelpPanel"]:
+        import cyclopts.help
+        from cyclopts.help import (
+            HelpPanel,
+            create_parameter_help_panel,
+            format_command_entries,
+            join_descriptions,
+        )
 
-        help_format = resolve_help_format(apps)
+        apps = route.apps
 
-        panels: Dict[str, Tuple[Group, HelpPanel]] = {}
+        panels: Dict[str, Tuple[Group, "HelpPanel"]] = {}
         # Handle commands first; there's an off chance they may be "upgraded"
         # to an argument/parameter panel.
         for subapp in walk_metas(apps[-1]):
             # Handle Commands
-            for group, elements in groups_from_app(subapp):
+            for group, elements in groups_from_app(subapp, promote_commands=False):
                 if not group.show:
                     continue
 
@@ -885,12 +1274,10 @@ class App:
                     panels[group.name] = (group, command_panel)
 
                 if group.help:
-                    import cyclopts.help
-
                     group_help = cyclopts.help._format(group.help, format=help_format)
 
                     if command_panel.description:
-                        command_panel.description = RichGroup(command_panel.description, NewLine(), group_help)
+                        command_panel.description = join_descriptions(command_panel.description, group_help)
                     else:
                         command_panel.description = group_help
 
@@ -922,8 +1309,8 @@ class App:
                     existing_panel.entries = new_panel.entries + existing_panel.entries  # Commands go last
                     if new_panel.description:
                         if existing_panel.description:
-                            existing_panel.description = RichGroup(
-                                existing_panel.description, NewLine(), new_panel.description
+                            existing_panel.description = join_descriptions(
+                                existing_panel.description, new_panel.description
                             )
                         else:
                             existing_panel.description = new_panel.description
@@ -973,6 +1360,10 @@ class App:
         `**kwargs`
             Get passed along to :meth:`parse_args`.
         """
+        with suppress(ImportError):
+            # By importing, makes things like the arrow-keys work.
+            import readline  # noqa: F401 # Not available on windows
+
         if os.name == "posix":
             print("Interactive shell. Press Ctrl-D to exit.")
         else:  # Windows
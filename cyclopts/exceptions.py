@@ -21,6 +21,7 @@ __all__ = [
     "DocstringError",
     "InvalidCommandError",
     "MissingArgumentError",
+    "ResponseFileError",
     "UnusedCliTokensError",
     "ValidationError",
 ]
@@ -302,17 +303,49 @@ class RepeatArgumentError(CycloptsError):
         return super().__str__() + f"Parameter {parameter_cli_name} specified multiple times."
 
 
-def format_cyclopts_error(e: Any):
-    from rich import box
-    from rich.panel import Panel
-    from rich.text import Text
-
-    panel = Panel(
-        Text(str(e), "default"),
-        title="Error",
-        box=box.ROUNDED,
-        expand=True,
-        title_align="left",
-        style="red",
-    )
-    return panel
+@define(kw_only=True)
+class ResponseFileError(CycloptsError):
+    """A response file (``@path`` token) could not be expanded."""
+
+    path: str
+    """
+    Path to the offending response file.
+    """
+
+    reason: str
+    """
+    Why the response file could not be expanded.
+    """
+
+    def __str__(self):
+        return super().__str__() + f'Response file "{self.path}": {self.reason}.'
+
+
+@define
+class ErrorPanel:
+    """Boxed error message; renderable by both :mod:`rich` and :class:`~cyclopts._plaintext.PlaintextConsole`."""
+
+    message: str
+
+    def __rich__(self):
+        from rich import box
+        from rich.panel import Panel
+        from rich.text import Text
+
+        return Panel(
+            Text(self.message, "default"),
+            title="Error",
+            box=box.ROUNDED,
+            expand=True,
+            title_align="left",
+            style="red",
+        )
+
+    def __plaintext__(self, width: int) -> str:
+        from cyclopts._plaintext import panel, wrap
+
+        return panel(wrap(self.message, width - 4), "Error", width)
+
+
+def format_cyclopts_error(e: Any) -> ErrorPanel:
+    return ErrorPanel(str(e))
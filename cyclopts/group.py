@@ -1,7 +1,7 @@
 import itertools
 from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Tuple, Union, cast
 
-from attrs import define, field
+from attrs import define, field, setters
 
 from cyclopts.utils import Sentinel, is_iterable
 
@@ -25,8 +25,18 @@ _sort_key_counter = itertools.count()
 
 NO_USER_SORT_KEY = Sentinel("NO_USER_SORT_KEY")
 
+# Incremented whenever an attribute of any ``Group`` is assigned.
+# ``App`` compares against it to discard command resolutions that depend on a mutated group.
+_mutation_count = 0
 
-@define
+
+def _count_mutation(instance, attribute, value):
+    global _mutation_count
+    _mutation_count += 1
+    return value
+
+
+@define(on_setattr=[setters.convert, setters.validate, _count_mutation])
 class Group:
     name: str = ""
 
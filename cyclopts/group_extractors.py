@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, List, Tuple, Union
 
 if TYPE_CHECKING:
     from cyclopts.core import App
@@ -27,8 +27,21 @@ def _create_or_append(
         group_mapping.append((group, [element]))
 
 
-def groups_from_app(app: "App") -> List[Tuple[Group, List["App"]]]:
-    """Extract Group/App association from all commands of ``app``."""
+def groups_from_app(app: "App", promote_commands: bool = True) -> List[Tuple[Group, List["App"]]]:
+    """Extract Group/App association from all commands of ``app``.
+
+    Parameters
+    ----------
+    app: App
+        App to extract command groups from.
+    promote_commands: bool
+        Promote lightweight registered-function entries to full :class:`App` objects.
+        If ``False``, the returned elements may be such entries; they only support listing attributes
+        (``name``, ``help``, ``show``, ``group``).
+    """
+    if promote_commands:
+        app._promote_commands()
+
     group_mapping: List[Tuple[Group, List["App"]]] = [
         (app.group_commands, []),
     ]
@@ -66,18 +79,3 @@ def groups_from_app(app: "App") -> List[Tuple[Group, List["App"]]]:
     group_mapping.sort(key=lambda x: x[0].name)
 
     return group_mapping
-
-
-def inverse_groups_from_app(input_app: "App") -> List[Tuple["App", List[Group]]]:
-    out = []
-    seen_apps = []
-    for group, apps in groups_from_app(input_app):
-        for app in apps:
-            try:
-                index = seen_apps.index(app)
-            except ValueError:
-                index = len(out)
-                out.append((app, []))
-                seen_apps.append(app)
-            out[index][1].append(group)
-    return out
@@ -1,6 +1,5 @@
-import inspect
 from enum import Enum
-from functools import lru_cache, partial
+from functools import partial
 from inspect import isclass
 from typing import (
     TYPE_CHECKING,
@@ -8,6 +7,7 @@ from typing import (
     Iterable,
     List,
     Literal,
+    Optional,
     Tuple,
     Type,
     Union,
@@ -15,10 +15,10 @@ from typing import (
     get_origin,
 )
 
-import docstring_parser
 from attrs import define, field, frozen
 
 import cyclopts.utils
+from cyclopts._docstring import DocstringMetadata, docstring_metadata, parse_help_string
 from cyclopts.group import Group
 from cyclopts.parameter import Parameter, get_hint_parameter
 
@@ -28,19 +28,40 @@ if TYPE_CHECKING:
     from cyclopts.core import App
 
 
-@lru_cache(maxsize=16)
-def docstring_parse(doc: str):
-    """Addon to :func:`docstring_parser.parse` that double checks the `short_description`."""
-    res = docstring_parser.parse(doc)
-    cleaned_doc = inspect.cleandoc(doc)
-    short = cleaned_doc.split("\n\n")[0]
-    if res.short_description != short:
-        if res.long_description is None:
-            res.long_description = res.short_description
-        elif res.short_description is not None:
-            res.long_description = res.short_description + "\n" + res.long_description
-        res.short_description = None
-    return res
+def _help_metadata(app) -> DocstringMetadata:
+    """Parsed :attr:`App.help` of an :class:`App` or a not-yet-promoted command entry."""
+    from cyclopts.core import _CommandEntry
+
+    help = app.help
+    command = app.command if type(app) is _CommandEntry else app._default_command
+    if callable(command) and help is command.__doc__:
+        # Help comes straight from the function's docstring.
+        return docstring_metadata(command)
+    return parse_help_string(help)
+
+
+@frozen
+class PlainText:
+    """Text without markup; only converted to a :class:`rich.text.Text` when rendered by :mod:`rich`."""
+
+    plain: str
+    style: str = ""
+
+    def __str__(self):
+        return self.plain
+
+    def __len__(self):
+        return len(self.plain)
+
+    def __rich__(self):
+        from rich.text import Text
+
+        return Text(self.plain, style=self.style)
+
+    def __plaintext__(self, width: int) -> str:
+        from cyclopts._plaintext import wrap
+
+        return "\n".join(wrap(self.plain, width))
 
 
 @frozen
@@ -51,17 +72,11 @@ class HelpEntry:
     required: bool = False
 
 
-def _text_factory():
-    from rich.text import Text
-
-    return Text()
-
-
 @define
 class HelpPanel:
     format: Literal["command", "parameter"]
     title: str
-    description: "RenderableType" = field(factory=_text_factory)
+    description: "RenderableType" = field(factory=lambda: PlainText(""))
     entries: List[HelpEntry] = field(factory=list)
 
     def remove_duplicates(self):
@@ -88,6 +103,8 @@ class HelpPanel:
 
         table = Table.grid(padding=(0, 1))
         panel_description = self.description
+        if isinstance(panel_description, PlainText):
+            panel_description = panel_description.__rich__()
 
         if isinstance(panel_description, Text):
             panel_description.end = ""
@@ -144,6 +161,45 @@ class HelpPanel:
 
         return panel
 
+    def __plaintext__(self, width: int) -> Optional[str]:
+        if not self.entries:
+            return None
+        from cyclopts._plaintext import panel, table, wrap
+
+        inner_width = width - 4
+        body = []
+        if self.description:
+            body.extend(wrap(str(self.description), inner_width))
+            body.append("")
+
+        if self.format == "command":
+            rows = []
+            for entry in self.entries:
+                name = entry.name
+                if entry.short:
+                    name += "," + entry.short
+                rows.append((name + " ", str(entry.description)))
+            body.extend(table(rows, inner_width))
+        elif self.format == "parameter":
+            has_short = any(entry.short for entry in self.entries)
+            has_required = any(entry.required for entry in self.entries)
+
+            rows = []
+            for entry in self.entries:
+                row = []
+                if has_required:
+                    row.append("*" if entry.required else "")
+                row.append(entry.name + " ")
+                if has_short:
+                    row.append(entry.short + " ")
+                row.append(str(entry.description))
+                rows.append(row)
+            body.extend(table(rows, inner_width, fixed_widths=[1] if has_required else []))
+        else:
+            raise NotImplementedError
+
+        return panel(body, self.title, width)
+
 
 class SilentRich:
     """Dummy object that causes nothing to be printed."""
@@ -153,6 +209,9 @@ class SilentRich:
         if False:
             yield
 
+    def __plaintext__(self, width: int) -> None:
+        return None
+
 
 _silent = SilentRich()
 
@@ -165,8 +224,6 @@ def format_usage(
     app,
     command_chain: List[str],
 ):
-    from rich.text import Text
-
     usage = []
     usage.append("Usage:")
     usage.append(app.name[0])
@@ -187,20 +244,16 @@ def format_usage(
                 to_show.add("[OPTIONS]")
         usage.extend(sorted(to_show))
 
-    return Text(" ".join(usage) + "\n", style="bold")
+    return PlainText(" ".join(usage) + "\n", style="bold")
 
 
 def format_doc(root_app, app: "App", format: str = "restructuredtext"):
-    from rich.console import Group as RichGroup
-    from rich.console import NewLine
-    from rich.text import Text
-
     raw_doc_string = app.help
 
     if not raw_doc_string:
         return _silent
 
-    parsed = docstring_parse(raw_doc_string)
+    parsed = _help_metadata(app)
 
     components: List[Union[str, Tuple[str, str]]] = []
     if parsed.short_description:
@@ -211,22 +264,38 @@ def format_doc(root_app, app: "App", format: str = "restructuredtext"):
             components.append("\n")
         components.append((parsed.long_description + "\n", "info"))
 
-    return RichGroup(_format(*components, format=format), NewLine())
+    doc = _format(*components, format=format)
+    if isinstance(doc, PlainText):
+        return PlainText(doc.plain + "\n")
+
+    from rich.console import Group as RichGroup
+    from rich.console import NewLine
+
+    return RichGroup(doc, NewLine())
+
+
+def join_descriptions(first: "RenderableType", second: "RenderableType") -> "RenderableType":
+    """Join two panel descriptions, separated by an empty line."""
+    if isinstance(first, PlainText) and isinstance(second, PlainText):
+        return PlainText(first.plain + "\n\n" + second.plain)
+
+    from rich.console import Group as RichGroup
+    from rich.console import NewLine
+
+    return RichGroup(first, NewLine(), second)
 
 
 def _format(*components: Union[str, Tuple[str, str]], format: str = "restructuredtext") -> "RenderableType":
     format = format.lower()
 
     if format == "plaintext":
-        from rich.text import Text
-
         aggregate = []
         for component in components:
             if isinstance(component, str):
                 aggregate.append(component)
             else:
                 aggregate.append(component[0])
-        return Text.assemble("".join(aggregate).rstrip())
+        return PlainText("".join(aggregate).rstrip())
     elif format in ("markdown", "md"):
         from rich.markdown import Markdown
 
@@ -340,7 +409,7 @@ def create_parameter_help_panel(
             help_append(rf"[env var: {env_vars}]", "dim")
 
         if cparam.show_default or (
-            cparam.show_default is None and iparam.default not in {None, inspect.Parameter.empty}
+            cparam.show_default is None and iparam.default is not None and iparam.default is not iparam.empty
         ):
             default = ""
             if isclass(type_) and issubclass(type_, Enum):
@@ -375,7 +444,7 @@ def format_command_entries(apps: Iterable["App"], format: str) -> List:
         entry = HelpEntry(
             name=",".join(long_names),
             short=",".join(short_names),
-            description=_format(docstring_parse(app.help).short_description or "", format=format),
+            description=_format(_help_metadata(app).short_description or "", format=format),
         )
         if entry not in entries:
             entries.append(entry)
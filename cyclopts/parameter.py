@@ -1,16 +1,14 @@
-import inspect
 from functools import partial
 from typing import (
     Any,
     Callable,
+    Dict,
     Iterable,
     Optional,
     Tuple,
     Type,
     Union,
     cast,
-    get_args,
-    get_origin,
 )
 
 import attrs
@@ -18,11 +16,10 @@ from attrs import field, frozen
 
 import cyclopts.utils
 from cyclopts._convert import (
-    AnnotatedType,
     convert,
+    get_hint_info,
     get_origin_and_validate,
-    resolve,
-    resolve_optional,
+    parameter_annotation,
 )
 from cyclopts.group import Group
 from cyclopts.utils import (
@@ -52,6 +49,15 @@ def _negative_converter(default: Tuple[str, ...]):
     return converter
 
 
+# Keyed by identity of ``Parameter.combine`` inputs; each value holds strong references to them so ids cannot be reused.
+_combine_cache: Dict[Tuple[int, ...], Tuple[Tuple[Any, ...], "Parameter"]] = {}
+_COMBINE_CACHE_MAXSIZE = 4096
+
+# Flyweight table of ``Parameter.combine`` results, keyed by their provided arguments.
+_interned: Dict[Tuple[Any, ...], "Parameter"] = {}
+_INTERNED_MAXSIZE = 4096
+
+
 @record_init("_provided_args")
 @frozen
 class Parameter:
@@ -124,20 +130,27 @@ class Parameter:
     # Populated by the record_attrs_init_args decorator.
     _provided_args: Tuple[str] = field(default=(), init=False, eq=False)
 
+    # Created once, instead of on every ``converter`` access.
+    _default_converter: Callable = field(init=False, eq=False)
+
+    @_default_converter.default  # pyright: ignore[reportAttributeAccessIssue]
+    def _default_converter_factory(self):
+        return partial(convert, name_transform=self.name_transform)
+
     @property
     def show(self):
         return self._show if self._show is not None else self.parse
 
     @property
     def converter(self):
-        return self._converter if self._converter else partial(convert, name_transform=self.name_transform)
+        return self._converter if self._converter else self._default_converter
 
     def get_negatives(self, type_, *names: str) -> Tuple[str, ...]:
-        type_ = get_origin(type_) or type_
+        info = get_hint_info(type_)
 
         if self.negative is not None:
             return self.negative  # pyright: ignore
-        elif type_ not in (bool, list, set):
+        elif not info.negatable:
             return ()
 
         out = []
@@ -150,7 +163,7 @@ class Parameter:
             else:
                 raise ValueError("All parameters should have started with '-' or '--'.")
 
-            negative_prefixes = self.negative_bool if type_ is bool else self.negative_iterable
+            negative_prefixes = self.negative_bool if info.hint is bool else self.negative_iterable
 
             for negative_prefix in negative_prefixes:
                 out.append(f"{negative_prefix}{name}")
@@ -169,7 +182,9 @@ class Parameter:
 
     @classmethod
     def combine(cls, *parameters: Optional["Parameter"]) -> "Parameter":
-        """Returns a new Parameter with values of ``parameters``.
+        """Returns a Parameter with values of ``parameters``.
+
+        Results are memoized and interned; identical inputs return the same (immutable) instance.
 
         Parameters
         ----------
@@ -177,15 +192,44 @@ class Parameter:
              Parameters who's attributes override ``self`` attributes.
              Ordered from least-to-highest attribute priority.
         """
+        parameters = tuple(x for x in parameters if x is not None)
+        key = (id(cls), *map(id, parameters))
+        try:
+            return _combine_cache[key][1]
+        except KeyError:
+            pass
+
         kwargs = {}
         for parameter in parameters:
-            if parameter is None:
-                continue
             for a in parameter.__attrs_attrs__:  # pyright: ignore[reportAttributeAccessIssue]
                 if a.init and a.alias in parameter._provided_args:
                     kwargs[a.alias] = getattr(parameter, a.name)
 
-        return cls(**kwargs)
+        combined = cls._intern(kwargs)
+
+        if len(_combine_cache) >= _COMBINE_CACHE_MAXSIZE:
+            _combine_cache.clear()
+        _combine_cache[key] = ((cls, parameters), combined)
+        return combined
+
+    @classmethod
+    def _intern(cls, kwargs: Dict[str, Any]) -> "Parameter":
+        """Get the shared instance of ``cls(**kwargs)``."""
+        # Groups are mutable (unhashable), so they are keyed by identity; the interned instance references them.
+        key = (cls, *((k, tuple(map(id, v)) if k == "group" else v) for k, v in kwargs.items()))
+        try:
+            return _interned[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable attribute value; cannot be interned.
+            return cls(**kwargs)
+
+        parameter = cls(**kwargs)
+        if len(_interned) >= _INTERNED_MAXSIZE:
+            _interned.clear()
+        _interned[key] = parameter
+        return parameter
 
     @classmethod
     def default(cls) -> "Parameter":
@@ -220,29 +264,5 @@ def get_hint_parameter(type_: Any, *default_parameters: Optional[Parameter]) ->
 
     If a ``cyclopts.Parameter`` is not found, a default Parameter is returned.
     """
-    cyclopts_parameters = []
-
-    if isinstance(type_, inspect.Parameter):
-        annotation = type_.annotation
-
-        if annotation is inspect.Parameter.empty or resolve(annotation) is Any:
-            if type_.default in (inspect.Parameter.empty, None):
-                annotation = str
-            else:
-                return get_hint_parameter(type(type_.default), *default_parameters)
-    else:
-        annotation = type_
-
-        if annotation is inspect.Parameter.empty:
-            annotation = str
-
-    annotation = resolve_optional(annotation)
-
-    if type(annotation) is AnnotatedType:
-        annotations = annotation.__metadata__  # pyright: ignore[reportGeneralTypeIssues]
-        annotation = get_args(annotation)[0]
-        cyclopts_parameters = [x for x in annotations if isinstance(x, Parameter)]
-    annotation = resolve(annotation)
-
-    cparam = Parameter.combine(*default_parameters, *cyclopts_parameters)
-    return annotation, cparam
+    info = get_hint_info(parameter_annotation(type_))
+    return info.hint, Parameter.combine(*default_parameters, *info.parameters)
@@ -5,17 +5,24 @@ All downstream functions should consume data "as is" without fallbacks.
 """
 
 import inspect
-from functools import cached_property
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast, get_origin
+from functools import cached_property, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
-from docstring_parser import parse as docstring_parse
+from attrs import frozen
 
 import cyclopts.utils
+from cyclopts._convert import HintInfo, compile_converter, get_hint_info, parameter_annotation
+from cyclopts._docstring import docstring_metadata
 from cyclopts.exceptions import DocstringError
 from cyclopts.group import Group
 from cyclopts.parameter import Parameter, get_hint_parameter
 from cyclopts.utils import ParameterDict
 
+# Shared instances, so that ``Parameter.combine`` results can be reused across commands.
+_EMPTY_HELP_STRING_PARAMETER = Parameter(help="")
+_REQUIRED_PARAMETER = Parameter(required=True)
+_NOT_REQUIRED_PARAMETER = Parameter(required=False)
+
 
 def _list_index(lst: List, key: Callable) -> int:
     """Returns index of first occurrence in list."""
@@ -98,29 +105,63 @@ def _resolve_docstring(f: Callable, signature: inspect.Signature) -> ParameterDi
     iparam_to_docstring_cparam = ParameterDict()
     if f.__doc__ is None:
         return iparam_to_docstring_cparam
-    f_docstring = docstring_parse(f.__doc__)
 
-    for dparam in f_docstring.params:
+    for arg_name, description in docstring_metadata(f).params.items():
         try:
-            iparam = signature.parameters[dparam.arg_name]
+            iparam = signature.parameters[arg_name]
         except KeyError:
             # Even though we could pass/continue, we're raising
             # an exception because the developer really aught to know.
-            raise DocstringError(
-                f"Docstring parameter {dparam.arg_name} has no equivalent in function signature."
-            ) from None
+            raise DocstringError(f"Docstring parameter {arg_name} has no equivalent in function signature.") from None
         else:
-            iparam_to_docstring_cparam[iparam] = Parameter(help=dparam.description)
+            iparam_to_docstring_cparam[iparam] = Parameter(help=description)
 
     return iparam_to_docstring_cparam
 
 
+def _implicit_true() -> bool:
+    return True
+
+
+@frozen(eq=False)
+class ParameterDescriptor:
+    """Per-parameter information consumed on every parse."""
+
+    index: int  # Slot of this parameter in per-parse storage; see :attr:`ResolvedCommand.descriptors`.
+    iparam: inspect.Parameter
+    cparam: Parameter
+    hint: Any
+    token_count: Optional[int]  # None for unsupported types.
+    consume_all: bool
+    allow_leading_hyphen: bool
+    # Converts this parameter's tokens, ``converter(*tokens)``; bound to the resolved type.
+    # For ``**kwargs``, converts the tokens of a single keyword.
+    converter: Callable[..., Any]
+
+
+def _compile_parameter_converter(iparam: inspect.Parameter, cparam: Parameter, hint: Any) -> Callable[..., Any]:
+    type_ = List[hint] if iparam.kind is iparam.VAR_POSITIONAL else hint
+    if cparam._converter:
+        return partial(cparam._converter, type_)
+    return compile_converter(type_, name_transform=cparam.name_transform)
+
+
 class ResolvedCommand:
+    """Fully resolved parsing plan for a single command.
+
+    Everything that only depends on the command's signature and the app configuration
+    is computed once here, so that :class:`~cyclopts.App` can cache and reuse this object
+    across many parses.
+    """
+
     command: Callable
     groups: List[Group]
     groups_iparams: List[Tuple[Group, List[inspect.Parameter]]]
     iparam_to_groups: ParameterDict
     iparam_to_cparam: ParameterDict
+    iparam_to_hint_info: ParameterDict
+    descriptors: List[ParameterDescriptor]
+    var_keyword_descriptor: Optional[ParameterDescriptor]
     name_to_iparam: Dict[str, inspect.Parameter]
 
     def __init__(
@@ -167,15 +208,14 @@ class ResolvedCommand:
         # Fully Resolve each Cyclopts Parameter
         self.iparam_to_cparam = ParameterDict()
         iparam_to_docstring_cparam = _resolve_docstring(f, signature) if parse_docstring else ParameterDict()
-        empty_help_string_parameter = Parameter(help="")
         for iparam, groups in self.iparam_to_groups.items():
             cparam = get_hint_parameter(
                 iparam,
-                empty_help_string_parameter,
+                _EMPTY_HELP_STRING_PARAMETER,
                 app_parameter,
                 *(x.default_parameter for x in groups),
                 iparam_to_docstring_cparam.get(iparam),
-                Parameter(required=iparam.default is iparam.empty),
+                _REQUIRED_PARAMETER if iparam.default is iparam.empty else _NOT_REQUIRED_PARAMETER,
             )[1]
 
             # Resolve name now that ``name_transform`` has been resolved.
@@ -191,6 +231,29 @@ class ResolvedCommand:
             cparam = Parameter.combine(Parameter(name=names), cparam)
             self.iparam_to_cparam[iparam] = cparam
 
+        # Precompute the type information consumed on every parse.
+        self.iparam_to_hint_info = ParameterDict()
+        for iparam in self.iparam_to_cparam:
+            self.iparam_to_hint_info[iparam] = get_hint_info(parameter_annotation(iparam))
+
+        self.descriptors = []
+        self.var_keyword_descriptor = None
+        for iparam, cparam in self.iparam_to_cparam.items():
+            info = self.iparam_to_hint_info[iparam]
+            descriptor = ParameterDescriptor(
+                len(self.descriptors),
+                iparam,
+                cparam,
+                info.hint,
+                info.token_count,
+                info.consume_all,
+                cparam.allow_leading_hyphen,
+                _compile_parameter_converter(iparam, cparam, info.hint),
+            )
+            self.descriptors.append(descriptor)
+            if iparam.kind is iparam.VAR_KEYWORD:
+                self.var_keyword_descriptor = descriptor
+
         self.bind = signature.bind_partial if _has_unparsed_parameters(signature, app_parameter) else signature.bind
 
         # Create a convenient group-to-iparam structure
@@ -202,7 +265,27 @@ class ResolvedCommand:
             for group in self.groups
         ]
 
-    @cached_property
+    def _cli_flags(self) -> Dict[str, Tuple[inspect.Parameter, Optional[Callable[[], Any]]]]:
+        """Maps CLI keywords to the python parameter and a factory of the flag's implicit value.
+
+        The factory is :obj:`None` if the value should be inferred from subsequent tokens.
+        Implicit values (e.g. ``[]`` for ``--empty-items``) may be mutable, so a fresh one is created per parse.
+        """
+        mapping: Dict[str, Tuple[inspect.Parameter, Optional[Callable[[], Any]]]] = {}
+
+        for iparam, cparam in self.iparam_to_cparam.items():
+            if iparam.kind is iparam.VAR_KEYWORD:
+                # Don't directly expose the kwarg variable name
+                continue
+            info: HintInfo = self.iparam_to_hint_info[iparam]
+            for name in cparam.name:
+                mapping[name] = (iparam, _implicit_true if info.hint is bool else None)
+            for name in cparam.get_negatives(info.hint, *cparam.name):
+                mapping[name] = (iparam, info.origin or info.hint)
+
+        return mapping
+
+    @property
     def cli2parameter(self) -> Dict[str, Tuple[inspect.Parameter, Any]]:
         """Creates a dictionary mapping CLI keywords to python keywords.
 
@@ -217,19 +300,17 @@ class ResolvedCommand:
            inferred from subsequent tokens.
         """
         # The tuple's second element is an implicit value for flags.
-        mapping: Dict[str, Tuple[inspect.Parameter, Any]] = {}
+        return {
+            cli: (iparam, None if factory is None else factory())
+            for cli, (iparam, factory) in self._cli_flags().items()
+        }
 
-        for iparam, cparam in self.iparam_to_cparam.items():
-            if iparam.kind is iparam.VAR_KEYWORD:
-                # Don't directly expose the kwarg variable name
-                continue
-            hint = get_hint_parameter(iparam)[0]
-            for name in cparam.name:
-                mapping[name] = (iparam, True if hint is bool else None)
-            for name in cparam.get_negatives(hint, *cparam.name):
-                mapping[name] = (iparam, (get_origin(hint) or hint)())
-
-        return mapping
+    @cached_property
+    def cli2descriptor(self) -> Dict[str, Tuple[ParameterDescriptor, Optional[Callable[[], Any]]]]:
+        """Same as :attr:`cli2parameter`, but maps to the :class:`ParameterDescriptor` and a factory of the implicit value."""
+        # Parameter names are unique within a signature.
+        name_to_descriptor = {x.iparam.name: x for x in self.descriptors}
+        return {cli: (name_to_descriptor[iparam.name], factory) for cli, (iparam, factory) in self._cli_flags().items()}
 
     @cached_property
     def parameter2cli(self) -> ParameterDict:
@@ -37,8 +37,12 @@ __all__ = [
 ########
 # Path #
 ########
+def _path_resolve(type_, token: str) -> Path:
+    return Path(token).resolve()
+
+
 def _path_resolve_converter(type_, *args):
-    return convert(type_, *args, converter=lambda _, x: Path(x).resolve())
+    return convert(type_, *args, converter=_path_resolve)
 
 
 ExistingPath = Annotated[Path, Parameter(validator=validators.Path(exists=True))]
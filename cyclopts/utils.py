@@ -1,8 +1,10 @@
 import functools
 import inspect
 import sys
+import weakref
 from collections.abc import MutableMapping
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from contextlib import suppress
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 _union_types = set()
 _union_types.add(Union)
@@ -13,27 +15,79 @@ if sys.version_info >= (3, 10):
 
 # fmt: off
 if sys.version_info >= (3, 10):
-    def signature(f: Any) -> inspect.Signature:
+    def _signature(f: Any) -> inspect.Signature:
         return inspect.signature(f, eval_str=True)
 else:
-    def signature(f: Any) -> inspect.Signature:
+    def _signature(f: Any) -> inspect.Signature:
         return inspect.signature(f)
 # fmt: on
 
+# Keyed by function identity; entries are dropped when the function is garbage collected.
+_signature_cache: "weakref.WeakKeyDictionary[Any, inspect.Signature]" = weakref.WeakKeyDictionary()
+# Bound methods are re-created on every attribute access, so they're keyed by their underlying function.
+_method_signature_cache: "weakref.WeakKeyDictionary[Any, inspect.Signature]" = weakref.WeakKeyDictionary()
+
+
+def signature(f: Any) -> inspect.Signature:
+    """Cached :func:`inspect.signature` that also evaluates string annotations (Python >=3.10).
+
+    Use :func:`clear_signature_cache` if a function's signature is modified at runtime.
+    """
+    if inspect.ismethod(f):
+        cache, key = _method_signature_cache, f.__func__
+    else:
+        cache, key = _signature_cache, f
+
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    except TypeError:  # Not weak-referenceable, or not hashable.
+        return _signature(f)
+
+    sig = _signature(f)
+    cache[key] = sig
+    return sig
+
+
+def clear_signature_cache(f: Optional[Callable] = None) -> None:
+    """Clear cached signatures of :func:`signature`.
+
+    Parameters
+    ----------
+    f: Optional[Callable]
+        Only clear the cached signature of this function.
+        If :obj:`None`, clear all cached signatures.
+    """
+    if f is None:
+        _signature_cache.clear()
+        _method_signature_cache.clear()
+        return
+
+    key = f.__func__ if inspect.ismethod(f) else f
+    for cache in (_signature_cache, _method_signature_cache):
+        with suppress(KeyError, TypeError):
+            del cache[key]
+
 
 def record_init(target: str):
-    """Class decorator that records init argument names as a tuple to ``target``."""
+    """Class decorator for attrs classes that records init argument names as a tuple to ``target``.
+
+    The names of the positional init arguments are derived from the attrs fields once, at class creation.
+    """
 
     def decorator(cls):
         original_init = cls.__init__
-        function_signature = signature(original_init)
+        positional_names = tuple(a.alias for a in cls.__attrs_attrs__ if a.init and not a.kw_only)
 
         @functools.wraps(original_init)
         def new_init(self, *args, **kwargs):
-            bound = function_signature.bind(self, *args, **kwargs)
             original_init(self, *args, **kwargs)
+            names = positional_names[: len(args)]
+            if kwargs:
+                names += tuple(kwargs)
             # Circumvent frozen protection.
-            object.__setattr__(self, target, tuple(k for k, v in bound.arguments.items() if v is not self))
+            object.__setattr__(self, target, names)
 
         cls.__init__ = new_init
         return cls
@@ -0,0 +1,70 @@
+import array
+import sys
+import types
+from typing import Optional
+
+import pytest
+
+from cyclopts import CoercionError, convert
+
+if sys.version_info >= (3, 12):
+    IntArray = array.array[int]
+elif sys.version_info >= (3, 9):
+    IntArray = types.GenericAlias(array.array, (int,))
+else:  # pragma: no cover
+    IntArray = None
+
+requires_generic_alias = pytest.mark.skipif(sys.version_info < (3, 9), reason="types.GenericAlias")
+
+
+def test_convert_array_bare():
+    res = convert(array.array, "1", "2.5")
+    assert res.typecode == "d"
+    assert res == array.array("d", [1.0, 2.5])
+
+
+@requires_generic_alias
+def test_convert_array_int():
+    res = convert(IntArray, "1", "0x10", str(2**62))
+    assert res.typecode == "q"
+    assert res == array.array("q", [1, 16, 2**62])
+
+
+@requires_generic_alias
+def test_convert_array_int_overflow():
+    with pytest.raises(CoercionError):
+        convert(IntArray, str(2**64))
+
+
+@requires_generic_alias
+def test_convert_array_invalid():
+    with pytest.raises(CoercionError):
+        convert(IntArray, "1", "foo")
+
+
+@requires_generic_alias
+def test_bind_array(app):
+    @app.default
+    def foo(indices: IntArray, *, weights: Optional[array.array] = None):  # pyright: ignore
+        if weights is None:
+            weights = array.array("d")
+        return indices, weights
+
+    indices, weights = app("1 2 3 --weights 0.5 --weights 1.5")
+    assert indices == array.array("q", [1, 2, 3])
+    assert weights == array.array("d", [0.5, 1.5])
+
+
+def test_bind_ndarray(app):
+    np = pytest.importorskip("numpy")
+    npt = pytest.importorskip("numpy.typing")
+
+    @app.default
+    def foo(indices: npt.NDArray[np.int32], *, weights: np.ndarray = np.zeros(0)):  # noqa: B008
+        return indices, weights
+
+    indices, weights = app("1 2 3 --weights 0.5")
+    assert indices.dtype == np.int32
+    assert indices.tolist() == [1, 2, 3]
+    assert weights.dtype == np.float64
+    assert weights.tolist() == [0.5]
@@ -4,7 +4,7 @@ from typing import Any, Optional
 
 import pytest
 
-from cyclopts import Parameter
+from cyclopts import App, Parameter
 from cyclopts.exceptions import (
     CoercionError,
     InvalidCommandError,
@@ -362,6 +362,34 @@ def test_bind_version_factory(app, capsys):
     assert captured.out == "1.2.3\n"
 
 
+def test_bind_version_default_deferred(mocker, capsys):
+    mock_default_version = mocker.patch("cyclopts.core._default_version", return_value="4.5.6")
+
+    app = App()
+
+    @app.command
+    def foo():
+        pass
+
+    mock_default_version.assert_not_called()
+
+    app(["--version"])
+    captured = capsys.readouterr()
+    assert captured.out == "4.5.6\n"
+    mock_default_version.assert_called_once_with(app._version_module)
+
+
+def test_bind_version_default():
+    app = App()
+    assert isinstance(app.version, str)
+
+    app.version = "1.2.3"
+    assert app.version == "1.2.3"
+
+    app.version = None
+    assert isinstance(app.version, str)
+
+
 @pytest.mark.parametrize(
     "cmd_str_e",
     [
@@ -378,3 +406,65 @@ def test_missing_keyword_argument(app, cmd_str_e):
 
     with pytest.raises(e):
         app.parse_args(cmd_str, print_error=False, exit_on_error=False)
+
+
+def test_bind_route_computed_once(app, mocker):
+    sub = App(name="sub")
+    app.command(sub)
+
+    @sub.command
+    def foo(a: int):
+        return a
+
+    spy = mocker.spy(App, "_route")
+    assert app("sub foo 1") == 1
+    assert spy.call_count == 1
+
+
+@pytest.mark.parametrize("tokens", ["sub foo --help", "--help sub foo", "sub --help foo"])
+def test_bind_route_computed_once_help(app, mocker, console, tokens):
+    sub = App(name="sub")
+    app.command(sub)
+
+    @sub.command
+    def foo(a: int):
+        """Foo help."""
+
+    spy = mocker.spy(App, "_route")
+    with console.capture() as capture:
+        app(tokens, console=console)
+    assert spy.call_count == 1
+    assert "Foo help." in capture.get()
+
+
+def test_bind_route_computed_once_meta_help(app, mocker, console):
+    @app.command
+    def foo(a: int):
+        """Foo help."""
+
+    @app.meta.default
+    def meta(*tokens: str):
+        pass
+
+    spy = mocker.spy(App, "_route")
+    with console.capture() as capture:
+        app.meta(["foo", "--help"], console=console)
+    assert spy.call_count == 1
+    assert "Foo help." in capture.get()
+
+
+@pytest.mark.parametrize("tokens", ["sub --help", ""])
+def test_bind_help_returns_public_help_print(app, console, tokens):
+    sub = App(name="sub")
+    app.command(sub)
+
+    command, bound = app.parse_args(tokens, console=console)
+    assert command == app.help_print
+    assert bound.arguments["tokens"] == tokens.split()[:1]
+    assert bound.arguments["console"] is console
+
+    with console.capture() as capture:
+        command(*bound.args, **bound.kwargs)
+    with console.capture() as expected:
+        app.help_print(tokens.split()[:1], console=console)
+    assert capture.get() == expected.get()
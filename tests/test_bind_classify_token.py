@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from cyclopts.bind import _NEGATIVE_NUMBER, _OPTION, _VALUE, _classify_token
+
+
+def _reference(token: str) -> int:
+    try:
+        complex(token)
+    except ValueError:
+        return _OPTION if token.startswith("-") else _VALUE
+    return _NEGATIVE_NUMBER if token.startswith("-") else _VALUE
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "foo",
+        "5",
+        "-",
+        "--",
+        "--foo",
+        "-v",
+        "-5",
+        "-5.",
+        "-.5",
+        "-5.5e-3",
+        "-1_000",
+        "-1__0",
+        "-inf",
+        "-infinity",
+        "-nan",
+        "-nope",
+        "-j",
+        "-1j",
+        "-1+2j",
+        "-e5",
+        "-5e",
+        "-5 ",
+        "-١",
+        "-(1+2j)",
+    ],
+)
+def test_classify_token(token):
+    assert _reference(token) == _classify_token(token)
+
+
+def test_classify_token_fuzz():
+    rng = random.Random(0)
+    alphabet = "-+.0123456789eEjJinfaINF_() x"
+    for _ in range(20_000):
+        token = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+        assert _reference(token) == _classify_token(token), token
@@ -38,3 +38,16 @@ def test_optional_set_empty_flag_default(app, cmd_str, expected, assert_parse_ar
         assert_parse_args(foo, cmd_str)
     else:
         assert_parse_args(foo, cmd_str, expected)
+
+
+def test_optional_list_empty_flag_fresh_per_call(app):
+    """The cached parse plan must not share the implicit empty list between calls."""
+
+    @app.default
+    def foo(items: Optional[List[int]] = None):
+        assert items is not None
+        items.append(1)
+        return items
+
+    for _ in range(3):
+        assert app("--empty-items") == [1]
@@ -0,0 +1,71 @@
+import random
+import shlex
+
+import pytest
+
+from cyclopts.bind import normalize_tokens, split
+
+
+def _reference(s: str):
+    try:
+        return shlex.split(s)
+    except ValueError as e:
+        return str(e)
+
+
+def _split(s: str):
+    try:
+        return split(s)
+    except ValueError as e:
+        return str(e)
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        "",
+        "   ",
+        "foo",
+        "foo bar",
+        "  foo \t bar\r\nbaz  ",
+        "foo\x0bbar\x0cbaz\xa0qux",
+        "'foo bar'",
+        '"foo bar"',
+        "''",
+        '""',
+        "foo'' bar",
+        "a'b'c\"d\"e",
+        "'foo\\' bar",
+        '"foo\\" bar"',
+        '"foo\\\\" bar',
+        '"\\a\\$\\`"',
+        "foo\\ bar",
+        "foo\\\nbar",
+        "\\'",
+        '\\"',
+        "--foo=\"hello world\" -v 'it''s'",
+        "foo #bar",
+        "foo\\",
+        "'foo",
+        '"foo',
+        '"foo\\',
+        '"foo\\\\',
+        '"foo\\"',
+        "foo 'bar",
+        "ünïcödé 'ünï cödé'",
+    ],
+)
+def test_split(s):
+    assert _reference(s) == _split(s)
+
+
+def test_split_fuzz():
+    rng = random.Random(0)
+    alphabet = "ab \t\n'\"\\#"
+    for _ in range(20_000):
+        s = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert _reference(s) == _split(s), repr(s)
+
+
+def test_normalize_tokens_str():
+    assert normalize_tokens("foo --bar 'baz qux'") == ["foo", "--bar", "baz qux"]
@@ -1,4 +1,6 @@
+import random
 import sys
+from enum import Enum
 from typing import Union
 
 import pytest
@@ -8,7 +10,7 @@ if sys.version_info < (3, 9):
 else:
     from typing import Annotated
 
-from cyclopts import Parameter
+from cyclopts import Parameter, convert
 from cyclopts.exceptions import CoercionError
 
 
@@ -51,3 +53,53 @@ def test_union_coercion_cannot_coerce_error(app):
 
     with pytest.raises(CoercionError):
         app.parse_args("foo", exit_on_error=False)
+
+
+class Color(Enum):
+    RED = 1
+    DARK_BLUE = 2
+
+
+def _reference_union_convert(members, token):
+    """Trial-and-error conversion; the union semantics the dispatch must preserve."""
+    for member in members:
+        try:
+            return convert(member, token)
+        except Exception:
+            pass
+    raise CoercionError
+
+
+@pytest.mark.parametrize(
+    "members",
+    [
+        (int, str),
+        (int, float, str),
+        (float, int),
+        (bool, int, float),
+        (complex, str),
+        (int, float, complex),
+        (Color, int, str),
+        (bool, Color),
+    ],
+)
+def test_union_dispatch_fuzz(members):
+    rng = random.Random(0)
+    alphabet = ["0", "1", "7", "_", ".", "e", "E", "-", "+", "j", "x", "b", "o", "f", "a", "y", " ", "٣"]
+    words = ["inf", "nan", "Infinity", "true", "no", "red", "dark-blue", "DARK_BLUE", "0x1f", "1e3"]
+    type_ = Union[members]  # pyright: ignore
+    for _ in range(2_000):
+        if rng.random() < 0.2:
+            token = rng.choice(words)
+        else:
+            token = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+
+        try:
+            expected = _reference_union_convert(members, token)
+        except CoercionError:
+            with pytest.raises(CoercionError):
+                convert(type_, token)
+        else:
+            actual = convert(type_, token)
+            assert type(expected) is type(actual), token
+            assert expected == actual or (expected != expected and actual != actual), token
@@ -6,3 +6,22 @@ def test_bind_var_pos(app):
         assert tokens == ("Alice",)
 
     app(["Alice"])
+
+
+def test_bind_var_pos_interleaved_keywords(app, assert_parse_args):
+    @app.default
+    def default(src: str, dst: str, *files: str, **defines: str):
+        pass
+
+    tokens = ["src", "dst"]
+    for i in range(1000):
+        tokens.extend((f"file_{i}", f"--key-{i}", f"value_{i}"))
+
+    assert_parse_args(
+        default,
+        tokens,
+        "src",
+        "dst",
+        *(f"file_{i}" for i in range(1000)),
+        **{f"key_{i}": f"value_{i}" for i in range(1000)},
+    )
@@ -1,5 +1,6 @@
 import inspect
 import sys
+import time
 from enum import Enum, auto
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Literal, Optional, Set, Tuple, Union
@@ -11,8 +12,8 @@ if sys.version_info < (3, 9):
 else:
     from typing import Annotated
 
-from cyclopts import CoercionError
-from cyclopts._convert import convert, resolve, token_count
+from cyclopts import CoercionError, Parameter
+from cyclopts._convert import compile_converter, convert, get_hint_info, resolve, token_count
 
 
 def _assert_tuple(expected, actual):
@@ -82,6 +83,40 @@ def test_token_count_iterable():
     assert (2, True) == token_count(Iterable[Tuple[int, int]])
 
 
+def test_token_count_unsupported():
+    with pytest.raises(TypeError):
+        token_count(Dict[str, int])
+    with pytest.raises(TypeError):
+        token_count(Tuple[int, dict])
+
+
+def test_hint_info_cached():
+    type_ = Annotated[Optional[List[int]], Parameter(name="--foo")]
+    info = get_hint_info(type_)
+    assert info is get_hint_info(type_)
+    assert info.hint == List[int]
+    assert info.origin is list
+    assert info.args == (int,)
+    assert info.parameters == (Parameter(name="--foo"),)
+    assert info.token_count == 1
+    assert info.consume_all is True
+    assert info.negatable is True
+
+
+def test_hint_info_unhashable_metadata():
+    type_ = Annotated[int, ["unhashable"]]
+    with pytest.raises(TypeError):
+        hash(type_)
+    assert (1, False) == token_count(type_)
+    assert get_hint_info(type_).hint is int
+
+
+def test_hint_info_union_order():
+    # ``Union[int, str] == Union[str, int]``, but the member order matters for coercion.
+    assert get_hint_info(Union[int, str]).args == (int, str)
+    assert get_hint_info(Union[str, int]).args == (str, int)
+
+
 def test_coerce_bool():
     assert True is convert(bool, "true")
     assert False is convert(bool, "false")
@@ -96,6 +131,56 @@ def test_coerce_int():
     assert 123 == convert(int, "123")
 
 
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        ("-123", -123),
+        ("1_000", 1000),
+        ("18446744073709551615", 2**64 - 1),
+        ("0xFF", 255),
+        ("0XfF", 255),
+        ("-0x10", -16),
+        ("0b1010", 10),
+        ("0o17", 15),
+        ("0x_ff_ff", 0xFFFF),
+        ("30.0", 30),
+        ("2.5", 2),
+        ("1e3", 1000),
+        ("9007199254740993.0", 2**53 + 1),
+    ],
+)
+def test_coerce_int_formats(token, expected):
+    assert expected == convert(int, token)
+
+
+@pytest.mark.parametrize("token", ["foo", "0x", "1.2.3", "nan"])
+def test_coerce_int_invalid(token):
+    with pytest.raises(CoercionError):
+        convert(int, token)
+
+
+@pytest.mark.parametrize("token", ["1e200000", "-1e500000", "1.5e100000", "inf"])
+def test_coerce_int_huge_exponent(token):
+    start = time.perf_counter()
+    with pytest.raises(CoercionError):
+        convert(int, token)
+    with pytest.raises(CoercionError):
+        convert(List[int], "1", token)
+    assert time.perf_counter() - start < 1
+
+
+def test_coerce_int_large_exponent():
+    assert 10**1000 == convert(int, "1e1000")
+
+
+def test_coerce_int_bulk():
+    assert [1, 2, 3] == convert(List[int], "1", "2", "3")
+    assert [1, 16, 2] == convert(List[int], "1", "0x10", "2.0")
+    assert (1, 16) == convert(Tuple[int, ...], "1", "0x10")
+    with pytest.raises(CoercionError):
+        convert(List[int], "1", "foo")
+
+
 def test_coerce_annotated_int():
     assert [123, 456] == convert(Annotated[int, "foo"], "123", "456")
     assert [123, 456] == convert(Annotated[List[int], "foo"], "123", "456")
@@ -143,6 +228,29 @@ def test_coerce_enum():
         convert(SoftwareEnvironment, "invalid-choice")
 
 
+def test_coerce_enum_list_many_members():
+    region = Enum("Region", {f"REGION_{i}": i for i in range(500)})
+    assert [region.REGION_499, region.REGION_0] == convert(List[region], "region-499", "region_0")
+
+
+def test_coerce_enum_transformed_name_collision():
+    class Color(Enum):
+        RED_ = 1
+        RED = 2
+
+    # Both transform to "red"; the first member wins.
+    assert Color.RED_ == convert(Color, "red")
+
+
+def test_coerce_literal_mixed():
+    assert "1" == convert(Literal["1", 1], "1")
+    assert 16 == convert(Literal["foo", 16], "0x10")
+    assert True is convert(Literal[True, 5], "true")
+    assert [5, "foo"] == convert(List[Literal["foo", 5]], "5", "foo")
+    with pytest.raises(CoercionError):
+        convert(Literal["foo", 5], "bar")
+
+
 def test_coerce_dict_error():
     with pytest.raises(TypeError):
         convert(dict, "this-doesnt-matter")
@@ -282,3 +390,32 @@ def test_resolve_annotated():
 def test_resolve_empty():
     res = resolve(inspect.Parameter.empty)
     assert res == str
+
+
+def test_convert_compiled_cached(mocker):
+    import cyclopts._convert
+
+    spy = mocker.spy(cyclopts._convert, "_compile_uncached")
+    type_ = List[Tuple[int, str]]
+    assert [(1, "foo")] == convert(type_, "1", "foo")
+    calls = spy.call_count
+    assert [(2, "bar"), (3, "baz")] == convert(type_, "2", "bar", "3", "baz")
+    assert spy.call_count == calls
+
+
+def test_compile_converter():
+    assert compile_converter(int)("1") == 1
+    assert compile_converter(int)("1", "2") == [1, 2]
+    assert compile_converter(List[int])("1") == [1]
+    assert compile_converter(Tuple[int, str])("1", "foo") == (1, "foo")
+
+
+def test_compile_converter_deferred_error():
+    f = compile_converter(dict)
+    with pytest.raises(TypeError):
+        f("foo")
+
+
+def test_convert_union_member_unsupported():
+    # The error of the unsupported member is deferred, so the other member can still be used.
+    assert "foo" == convert(Union[Tuple[dict, int], str], "foo")
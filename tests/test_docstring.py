@@ -0,0 +1,85 @@
+import gc
+
+import cyclopts._docstring
+from cyclopts import App
+from cyclopts._docstring import _docstring_cache, docstring_metadata, parse_docstring
+
+
+def test_docstring_metadata():
+    def foo(a, b):
+        """Short description.
+
+        Long description.
+
+        Parameters
+        ----------
+        a: int
+            Docstring for a.
+        b: int
+            Docstring for b.
+        """
+
+    metadata = docstring_metadata(foo)
+    assert metadata.short_description == "Short description."
+    assert metadata.long_description == "Long description."
+    assert metadata.params == {"a": "Docstring for a.", "b": "Docstring for b."}
+
+
+def test_docstring_metadata_no_short_description():
+    metadata = parse_docstring("Sentence one\nstill sentence one.\n\nSentence two.")
+    assert metadata.short_description is None
+    assert metadata.long_description == "Sentence one\nstill sentence one.\n\nSentence two."
+
+
+def test_docstring_metadata_cached():
+    def foo():
+        """Foo short description."""
+
+    class Bar:
+        def method(self):
+            """Method short description."""
+
+    assert docstring_metadata(foo) is docstring_metadata(foo)
+    # Bound methods are re-created on every attribute access.
+    assert docstring_metadata(Bar().method) is docstring_metadata(Bar().method)
+
+    foo.__doc__ = "Modified short description."
+    assert docstring_metadata(foo).short_description == "Modified short description."
+
+
+def test_docstring_metadata_weakref_eviction():
+    def foo():
+        """Foo short description."""
+
+    docstring_metadata(foo)
+    gc.collect()
+    n_cached = len(_docstring_cache)
+    del foo
+    gc.collect()
+    assert len(_docstring_cache) == n_cached - 1
+
+
+def test_docstring_metadata_shared(mocker, console):
+    parse_docstring = mocker.spy(cyclopts._docstring, "parse_docstring")
+    app = App(help="App help.")
+
+    def command(a: int):
+        """Short description.
+
+        Parameters
+        ----------
+        a: int
+            Docstring for a.
+        """
+
+    n_commands = 20
+    for i in range(n_commands):
+        app.command(command, name=f"command-{i}")
+
+    with console.capture():
+        for _ in range(2):
+            app.help_print([], console=console)
+            app.help_print(["command-0"], console=console)
+    app.parse_args(["command-1", "1"])
+
+    assert parse_docstring.call_count == 1
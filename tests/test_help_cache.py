@@ -0,0 +1,203 @@
+import io
+import os
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+import cyclopts
+import cyclopts.resolve
+from cyclopts import App, Group, Parameter, _help_cache
+from cyclopts._plaintext import PlaintextConsole
+
+
+def _console(width=70):
+    return Console(file=io.StringIO(), width=width, force_terminal=True, highlight=False, legacy_windows=False)
+
+
+@pytest.fixture
+def cached_app(tmp_path):
+    app = App(name="my-app", help="App help.", help_cache_dir=tmp_path / "help")
+
+    @app.command
+    def foo(a: int, *, b: str = "bar"):
+        """Foo help.
+
+        Parameters
+        ----------
+        a: int
+            Help for a.
+        """
+
+    return app
+
+
+@pytest.fixture
+def render_help(mocker):
+    return mocker.spy(App, "_render_help")
+
+
+@pytest.mark.parametrize("tokens", [[], ["foo"]])
+@pytest.mark.parametrize("console_factory", [_console, lambda: PlaintextConsole(file=io.StringIO(), width=70)])
+def test_help_cache_hit(cached_app, render_help, tokens, console_factory):
+    expected = console_factory()
+    App._render_help(cached_app, cached_app._route(tokens), expected)
+    render_help.reset_mock()
+
+    for _ in range(2):
+        console = console_factory()
+        cached_app.help_print(tokens, console=console)
+        assert console.file.getvalue() == expected.file.getvalue()
+    render_help.assert_called_once()
+    assert len(list(cached_app.help_cache_dir.iterdir())) == 1
+
+
+@pytest.mark.parametrize("console_factory", [_console, lambda: PlaintextConsole(file=io.StringIO(), width=70)])
+def test_help_cache_capture(cached_app, render_help, console_factory):
+    expected = console_factory()
+    App._render_help(cached_app, cached_app._route([]), expected)
+
+    for _ in range(2):  # Cache-miss, then cache-hit.
+        console = console_factory()
+        with console.capture() as capture:
+            cached_app.help_print([], console=console)
+        assert capture.get() == expected.file.getvalue()
+        assert console.file.getvalue() == ""
+    assert render_help.call_count == 2
+
+
+def test_help_cache_record(cached_app, render_help):
+    expected = Console(file=io.StringIO(), width=70, force_terminal=True, record=True)
+    App._render_help(cached_app, cached_app._route([]), expected)
+
+    for _ in range(2):  # Cache-miss, then cache-hit.
+        console = Console(file=io.StringIO(), width=70, force_terminal=True, record=True)
+        cached_app.help_print([], console=console)
+        assert console.file.getvalue() == expected.file.getvalue()
+        assert console.export_html() == expected.export_html(clear=False)
+    assert render_help.call_count == 2
+
+
+def test_help_cache_invalidation(cached_app, render_help):
+    cached_app.help_print([], console=_console())
+    cached_app.help_print([], console=_console(width=80))
+    assert render_help.call_count == 2
+
+    cached_app.help = "Different app help."
+    console = _console()
+    cached_app.help_print([], console=console)
+    assert render_help.call_count == 3
+    assert "Different app help." in console.file.getvalue()
+
+    cached_app["foo"].help = "Different foo help."
+    cached_app.help_print([], console=_console())
+    assert render_help.call_count == 4
+
+
+def test_help_cache_source_mtime(tmp_path, monkeypatch, render_help):
+    module_name = "cyclopts_test_help_cache_module"
+    module_path = tmp_path / f"{module_name}.py"
+    module_path.write_text(
+        textwrap.dedent(
+            '''\
+            def some_command(a: int):
+                """Short description of some_command."""
+            '''
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        module = __import__(module_name)
+        app = App(name="my-app", help_cache_dir=tmp_path / "help")
+        app.command(module.some_command)
+
+        app.help_print(["some-command"], console=_console())
+        app.help_print(["some-command"], console=_console())
+        assert render_help.call_count == 1
+
+        stat = module_path.stat()
+        os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        app.help_print(["some-command"], console=_console())
+        assert render_help.call_count == 2
+    finally:
+        sys.modules.pop(module_name, None)
+
+
+def test_help_cache_cyclopts_version(cached_app, render_help, monkeypatch):
+    cached_app.help_print([], console=_console())
+    monkeypatch.setattr(cyclopts, "__version__", cyclopts.__version__ + ".post1")
+    cached_app.help_print([], console=_console())
+    assert render_help.call_count == 2
+
+
+def test_help_cache_cyclopts_source_mtime(cached_app, render_help, monkeypatch):
+    """Editing any cyclopts module, not just the help-rendering ones, invalidates the cache."""
+    resolve_path = Path(cyclopts.resolve.__file__)
+    assert resolve_path in _help_cache._cyclopts_sources
+
+    cached_app.help_print([], console=_console())
+
+    mtime = _help_cache._mtime
+
+    def edited_mtime(path, mtimes):
+        out = mtime(path, mtimes)
+        return out + 1 if path == resolve_path else out
+
+    monkeypatch.setattr(_help_cache, "_mtime", edited_mtime)
+    cached_app.help_print([], console=_console())
+    assert render_help.call_count == 2
+
+
+def test_help_cache_unwritable(tmp_path, render_help):
+    not_a_directory = tmp_path / "file"
+    not_a_directory.touch()
+    app = App(name="my-app", help="App help.", help_cache_dir=not_a_directory)
+
+    for _ in range(2):
+        console = _console()
+        app.help_print([], console=console)
+        assert "App help." in console.file.getvalue()
+    assert render_help.call_count == 2
+
+
+def test_help_cache_inherited(tmp_path, render_help):
+    app = App(name="my-app", help_cache_dir=tmp_path)
+    app.command(sub_app := App(name="foo", help="Foo help."))
+
+    app.help_print(["foo"], console=_console())
+    app.help_print(["foo"], console=_console())
+    assert render_help.call_count == 1
+
+    sub_app.help_cache_dir = tmp_path / "other"
+    app.help_print(["foo"], console=_console())
+    assert render_help.call_count == 2
+    assert len(list((tmp_path / "other").iterdir())) == 1
+
+
+@pytest.mark.parametrize(
+    "configure",
+    [
+        lambda app: setattr(app, "default_parameter", Parameter(negative=(), show_default=False)),
+        lambda app: setattr(app, "group_parameters", Group("Parameters", default_parameter=Parameter(negative=()))),
+        lambda app: setattr(app, "group_parameters", Group("Parameters", validator=lambda **kwargs: None)),
+        lambda app: setattr(app, "group_commands", Group("Commands", sort_key=1)),
+    ],
+)
+def test_help_cache_invalidation_configuration(tmp_path, render_help, configure):
+    app = App(name="my-app", help_cache_dir=tmp_path)
+
+    @app.default
+    def default(*, flag: bool = False, value: int = 5):
+        pass
+
+    app.help_print([], console=_console())
+    configure(app)
+    console = _console()
+    app.help_print([], console=console)
+    assert render_help.call_count == 2
+
+    expected = _console()
+    App._render_help(app, app._route([]), expected)
+    assert console.file.getvalue() == expected.file.getvalue()
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import cyclopts
+
+# Generous; only intended to catch a heavy dependency sneaking back into the import path.
+_IMPORT_TIME_BUDGET_US = 250_000
+
+_simple_app_script = """\
+import cyclopts
+
+app = cyclopts.App()
+
+@app.command
+def foo(a: int, b: str = "bar"):
+    pass
+
+app.parse_args(["foo", "1", "--b", "baz"])
+"""
+
+
+def _importtime(script):
+    """Run ``script`` with ``-X importtime``; returns a mapping of module names to their self import time."""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(Path(cyclopts.__file__).parent.parent), env.get("PYTHONPATH")])
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    out = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():  # header
+            continue
+        out[name.strip()] = int(self_us)
+    return out
+
+
+@pytest.fixture(scope="module")
+def simple_app_imports():
+    return _importtime(_simple_app_script)
+
+
+@pytest.mark.parametrize("module", ["rich", "docstring_parser", "readline", "cyclopts.help", "cyclopts.types"])
+def test_import_simple_app_lazy(simple_app_imports, module):
+    assert module not in simple_app_imports
+
+
+def test_import_simple_app_time_budget(simple_app_imports):
+    cyclopts_time = sum(t for name, t in simple_app_imports.items() if name.split(".")[0] == "cyclopts")
+    assert cyclopts_time < _IMPORT_TIME_BUDGET_US
+
+
+def test_import_lazy_exports():
+    for name in cyclopts.__all__:
+        assert getattr(cyclopts, name) is not None
+    assert set(cyclopts.__all__) <= set(dir(cyclopts))
+
+    with pytest.raises(AttributeError):
+        cyclopts.this_does_not_exist  # noqa: B018
@@ -0,0 +1,76 @@
+import sys
+import textwrap
+
+import pytest
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    module_name = "cyclopts_test_lazy_module"
+    (tmp_path / f"{module_name}.py").write_text(
+        textwrap.dedent(
+            '''\
+            def some_command(a: int, b: int = 2):
+                """Short description of some_command.
+
+                Parameters
+                ----------
+                a: int
+                    Docstring for a.
+                """
+                return a + b
+            '''
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield module_name
+    sys.modules.pop(module_name, None)
+
+
+def test_lazy_command_execute(app, lazy_module):
+    app.command(f"{lazy_module}:some_command")
+    assert lazy_module not in sys.modules
+
+    assert app("some-command 1 --b=5", exit_on_error=False) == 6
+    assert lazy_module in sys.modules
+
+
+def test_lazy_command_explicit_name(app, lazy_module):
+    app.command(f"{lazy_module}:some_command", name="foo")
+    assert "foo" in app
+    assert app("foo 1", exit_on_error=False) == 3
+
+
+def test_lazy_command_root_help_no_import(app, lazy_module, console):
+    app.command(f"{lazy_module}:some_command", help="Stored short description.")
+
+    with console.capture() as capture:
+        app.help_print([], console=console)
+
+    assert "some-command  Stored short description." in capture.get()
+    assert lazy_module not in sys.modules
+
+
+def test_lazy_command_help_imports(app, lazy_module, console):
+    app.command(f"{lazy_module}:some_command")
+
+    with console.capture() as capture:
+        app.help_print(["some-command"], console=console)
+
+    actual = capture.get()
+    assert lazy_module in sys.modules
+    assert "Short description of some_command." in actual
+    assert "Docstring for a." in actual
+
+
+def test_lazy_command_parse_commands_imports(app, lazy_module):
+    app.command(f"{lazy_module}:some_command")
+    command_chain, apps, _ = app.parse_commands(["some-command"])
+    assert command_chain == ["some-command"]
+    assert lazy_module in sys.modules
+    assert apps[-1].default_command is sys.modules[lazy_module].some_command
+
+
+def test_lazy_command_bad_import_path(app):
+    with pytest.raises(ValueError):
+        app.command("no_colon_in_path")
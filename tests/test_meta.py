@@ -31,3 +31,37 @@ def test_meta_basic(app, cmd_str):
         app(tokens)
 
     app.meta(cmd_str)
+
+
+def test_meta_command_table_cached(app):
+    @app.command
+    def foo():
+        pass
+
+    app.parse_commands(["foo"])
+    table = app._command_table
+    assert table is not None
+
+    assert app.parse_commands(["foo"]) == (["foo"], [app, app["foo"]], [])
+    assert app._command_table is table
+
+
+def test_meta_command_table_invalidate(app):
+    @app.command
+    def foo():
+        pass
+
+    assert app.parse_commands(["bar"])[0] == []
+
+    # Registering a command to the meta-app must be visible from the app.
+    @app.meta.command
+    def bar():
+        pass
+
+    assert app.parse_commands(["bar"])[0] == ["bar"]
+
+    del app.meta["bar"]
+    assert app.parse_commands(["bar"])[0] == []
+
+    del app["foo"]
+    assert app.parse_commands(["foo"])[0] == []
@@ -9,7 +9,7 @@ if sys.version_info < (3, 9):
 else:
     from typing import Annotated
 
-from cyclopts import Parameter
+from cyclopts import Group, Parameter
 from cyclopts.parameter import get_hint_parameter
 
 
@@ -142,6 +142,46 @@ def test_parameter_combine_priority_none():
     assert p_combined.negative is None
 
 
+def test_parameter_combine_memoized():
+    p1 = Parameter(negative="--foo")
+    p2 = Parameter(show_default=False)
+
+    assert Parameter.combine(p1, p2) is Parameter.combine(p1, None, p2)
+
+
+def test_parameter_combine_interned():
+    p1 = Parameter(negative="--foo")
+    p2 = Parameter(negative="--foo")
+
+    # Distinct, but identical, inputs produce the same shared instance.
+    assert Parameter.combine(p1) is Parameter.combine(p2)
+    # Differing provided arguments must not be shared, even if the values are equal.
+    assert Parameter.combine(p1) is not Parameter.combine(Parameter.default(), p1)
+
+
+def test_parameter_combine_interned_group():
+    group1, group2 = Group("Foo"), Group("Foo")
+
+    p1 = Parameter.combine(Parameter(group=group1))
+    p2 = Parameter.combine(Parameter(group=group2))
+
+    assert p1 is not p2
+    assert p1.group[0] is group1
+    assert p2.group[0] is group2
+
+
+def test_parameter_converter_cached():
+    p = Parameter()
+    assert p.converter is p.converter
+    assert p.converter(int, "5") == 5
+
+
+def test_parameter_provided_args():
+    assert Parameter()._provided_args == ()
+    assert Parameter("--foo", help="bar")._provided_args == ("name", "help")
+    assert Parameter(converter=int, name_transform=str.upper)._provided_args == ("converter", "name_transform")
+
+
 def test_parameter_default():
     p1 = Parameter()
     p2 = Parameter.default()
@@ -0,0 +1,142 @@
+import io
+import random
+import sys
+from typing import List, Literal, Optional
+
+import pytest
+from rich.console import Console
+from rich.text import Text
+
+from cyclopts import App, CycloptsError, Group, Parameter
+from cyclopts._plaintext import PlaintextConsole, wrap
+
+if sys.version_info < (3, 9):
+    from typing_extensions import Annotated
+else:
+    from typing import Annotated
+
+
+def _rich_console(width):
+    return Console(
+        file=io.StringIO(),
+        width=width,
+        force_terminal=False,
+        highlight=False,
+        color_system=None,
+        legacy_windows=False,
+    )
+
+
+def _build_app():
+    app = App(
+        name="my-app",
+        help_format="plaintext",
+        help="My application summary.\n\nA long description that is long enough to require wrapping on narrow consoles.",
+    )
+
+    @app.command
+    def foo(
+        a: int,
+        b: Annotated[str, Parameter(name=["--bee", "-b"], help="Bee help that is long enough to wrap around.")] = "x",
+        *,
+        c: Literal["x", "y"] = "y",
+        d: bool = False,
+        e: Annotated[Optional[List[int]], Parameter(env_var="MY_APP_E")] = None,
+    ):
+        """Foo short description.
+
+        Parameters
+        ----------
+        a: int
+            Help for a.
+        """
+
+    @app.command(group=Group("Admin", help="Administrative commands."))
+    def bar(*, y: int):
+        """Bar short description."""
+
+    return app
+
+
+def test_plaintext_wrap_fuzz():
+    rng = random.Random(0)
+    alphabet = ["a", "bb", "cccc", "d" * 15, " ", "  ", "\n", "\t", "-", "e" * 40]
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        width = rng.randint(1, 30)
+        expected = [line.plain for line in Text(text).wrap(_rich_console(width), width)]
+        assert wrap(text, width) == expected, (text, width)
+
+
+@pytest.mark.parametrize("width", [40, 70, 120])
+@pytest.mark.parametrize("tokens", [[], ["foo"], ["bar"]])
+def test_plaintext_help_matches_rich(width, tokens):
+    rich_console = _rich_console(width)
+    _build_app().help_print(tokens, console=rich_console)
+
+    plaintext_console = PlaintextConsole(file=io.StringIO(), width=width)
+    _build_app().help_print(tokens, console=plaintext_console)
+
+    assert plaintext_console.file.getvalue() == rich_console.file.getvalue()
+
+
+@pytest.mark.parametrize("width", [40, 70])
+@pytest.mark.parametrize("tokens", [["foo", "not-an-int"], ["foo"], ["bar", "--y", "z" * 60]])
+def test_plaintext_error_matches_rich(width, tokens):
+    outputs = []
+    for console in (_rich_console(width), PlaintextConsole(file=io.StringIO(), width=width)):
+        with pytest.raises(CycloptsError):
+            _build_app()(tokens, console=console, exit_on_error=False)
+        outputs.append(console.file.getvalue())
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize(
+    "renderer, help_format, expected",
+    [
+        (None, "plaintext", PlaintextConsole),
+        (None, "restructuredtext", Console),
+        ("auto", "plaintext", PlaintextConsole),
+        ("plaintext", "restructuredtext", PlaintextConsole),
+        ("rich", "plaintext", Console),
+    ],
+)
+def test_plaintext_renderer_help(renderer, help_format, expected):
+    app = App(renderer=renderer, help_format=help_format)
+    route = app._route([])
+    assert isinstance(app._resolve_console(route, for_help=True), expected)
+
+
+@pytest.mark.parametrize(
+    "renderer, isatty, expected",
+    [
+        (None, False, PlaintextConsole),
+        (None, True, Console),
+        ("plaintext", True, PlaintextConsole),
+        ("rich", False, Console),
+    ],
+)
+def test_plaintext_renderer_error(mocker, renderer, isatty, expected):
+    mocker.patch("sys.stdout.isatty", return_value=isatty)
+    app = App(renderer=renderer)
+
+    @app.default
+    def default(a: int):
+        pass
+
+    with pytest.raises(CycloptsError) as e:
+        app.parse_args(["not-an-int"], print_error=False, exit_on_error=False)
+    assert isinstance(e.value.console, expected)
+
+
+def test_plaintext_renderer_inherited(console):
+    app = App(renderer="plaintext")
+    app.command(sub_app := App(name="foo"))
+    route = app._route(["foo"])
+    assert isinstance(app._resolve_console(route), PlaintextConsole)
+
+    sub_app.renderer = "rich"
+    assert isinstance(app._resolve_console(route), Console)
+
+    # An explicitly provided console always takes precedence.
+    assert app._resolve_console(route, console) is console
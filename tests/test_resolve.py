@@ -66,3 +66,37 @@ def test_group_name_collision():
 
     with pytest.raises(ValueError):
         ResolvedCommand(foo)
+
+
+def test_resolve_descriptors():
+    def foo(a: Annotated[int, Parameter(allow_leading_hyphen=True)], *b: str, c: bool = False, **d: str):
+        pass
+
+    res = ResolvedCommand(foo)
+    assert [x.index for x in res.descriptors] == [0, 1, 2, 3]
+    assert [x.iparam.name for x in res.descriptors] == ["a", "b", "c", "d"]
+    assert [x.cparam for x in res.descriptors] == list(res.iparam_to_cparam.values())
+    assert res.descriptors[0].allow_leading_hyphen is True
+    assert res.descriptors[1].hint is str
+    assert res.var_keyword_descriptor is res.descriptors[3]
+    descriptor, implicit_factory = res.cli2descriptor["--c"]
+    assert descriptor is res.descriptors[2]
+    assert implicit_factory() is True
+    descriptor, implicit_factory = res.cli2descriptor["--no-c"]
+    assert descriptor is res.descriptors[2]
+    assert implicit_factory() is False
+
+
+def test_resolve_descriptors_converter():
+    def custom_converter(type_, *tokens):
+        return type_, tokens
+
+    def foo(a: int, *b: int, c: Annotated[str, Parameter(converter=custom_converter)] = "", **d: float):
+        pass
+
+    res = ResolvedCommand(foo)
+    a, b, c, d = res.descriptors
+    assert a.converter("1") == 1
+    assert b.converter("1", "2") == [1, 2]
+    assert c.converter("x", "y") == (str, ("x", "y"))
+    assert d.converter("1.5") == 1.5
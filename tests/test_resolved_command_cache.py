@@ -0,0 +1,119 @@
+import sys
+
+import pytest
+
+from cyclopts import App, Group, Parameter, UnusedCliTokensError
+
+if sys.version_info < (3, 9):
+    from typing_extensions import Annotated
+else:
+    from typing import Annotated
+
+
+def test_resolved_command_cache_reused(app):
+    @app.command
+    def foo(a: int):
+        pass
+
+    first = app._resolve_command(app._route(["foo", "1"]), parse_docstring=False)
+    second = app._resolve_command(app._route(["foo", "2"]), parse_docstring=False)
+    assert first is second
+
+    # Different docstring-parsing requirements produce different plans.
+    assert app._resolve_command(app._route(["foo"]), parse_docstring=True) is not first
+
+
+def test_resolved_command_cache_invalidate_command(app):
+    @app.command
+    def foo(a: int):
+        pass
+
+    first = app._resolve_command(app._route(["foo"]), parse_docstring=False)
+
+    @app.command
+    def bar():
+        pass
+
+    assert app._resolve_command(app._route(["foo"]), parse_docstring=False) is not first
+
+
+def test_resolved_command_cache_invalidate_default(app):
+    @app.default
+    def foo(a: int):
+        pass
+
+    assert app("1") is None
+    first = app._resolve_command(app._route([]), parse_docstring=False)
+
+    def bar(b: str):
+        return b
+
+    app.default_command = bar
+    second = app._resolve_command(app._route([]), parse_docstring=False)
+    assert second is not first
+    assert second.command is bar
+    assert app("1") == "1"
+
+
+def test_resolved_command_cache_invalidate_default_parameter(app):
+    @app.command
+    def foo(a: int):
+        return a
+
+    assert app("foo --a 1") == 1
+
+    app.default_parameter = Parameter(name_transform=lambda s: s.upper())
+    assert app("foo --A 2") == 2
+
+
+def test_resolved_command_cache_invalidate_subapp_default_parameter(app):
+    sub = App(name="sub")
+    app.command(sub)
+
+    @sub.command
+    def foo(a: int):
+        return a
+
+    assert app("sub foo --a 1") == 1
+
+    # Modifying a nested app must invalidate the root app's cache.
+    sub.default_parameter = Parameter(name_transform=lambda s: s.upper())
+    assert app("sub foo --A 2") == 2
+
+
+def test_resolved_command_cache_invalidate_group_parameters(app):
+    @app.default
+    def foo(a: int):
+        pass
+
+    first = app._resolve_command(app._route([]), parse_docstring=False)
+    app.group_parameters = Group("Custom Parameters")
+    second = app._resolve_command(app._route([]), parse_docstring=False)
+
+    assert second is not first
+    assert second.groups[0].name == "Custom Parameters"
+
+
+def test_resolved_command_cache_invalidate_group_mutation(app):
+    @app.default
+    def foo(*, flag: bool = False):
+        return flag
+
+    assert app("--no-flag") is False
+
+    app.group_parameters.default_parameter = Parameter(negative=())
+    with pytest.raises(UnusedCliTokensError):
+        app("--no-flag", exit_on_error=False, print_error=False)
+
+
+def test_resolved_command_cache_invalidate_annotated_group_mutation(app):
+    group = Group("Custom")
+
+    @app.default
+    def foo(*, flag: Annotated[bool, Parameter(group=group)] = False):
+        return flag
+
+    assert app("--no-flag") is False
+
+    group.default_parameter = Parameter(negative="--disable-flag")
+    assert app("--disable-flag") is False
@@ -0,0 +1,71 @@
+from typing import List
+
+import pytest
+
+from cyclopts import CoercionError, ResponseFileError
+from cyclopts.bind import expand_response_files
+
+
+def test_expand_response_files_basic(tmp_path):
+    path = tmp_path / "args.txt"
+    path.write_text("""--verbose "file with space.txt"\n'single $quoted' a\\ b "esc \\"q\\" \\\\ \\n" ''\n""")
+    assert expand_response_files(["foo", f"@{path}", "bar"]) == [
+        "foo",
+        "--verbose",
+        "file with space.txt",
+        "single $quoted",
+        "a b",
+        'esc "q" \\ \\n',
+        "",
+        "bar",
+    ]
+
+
+def test_expand_response_files_nested(tmp_path):
+    inner = tmp_path / "inner.txt"
+    inner.write_text("2 3")
+    outer = tmp_path / "outer.txt"
+    outer.write_text(f"1 @{inner} 4")
+    assert expand_response_files([f"@{outer}"]) == ["1", "2", "3", "4"]
+
+
+def test_expand_response_files_empty(tmp_path):
+    path = tmp_path / "args.txt"
+    path.write_text("")
+    assert expand_response_files(["@", f"@{path}"]) == ["@"]
+
+
+def test_expand_response_files_max_depth(tmp_path):
+    path = tmp_path / "args.txt"
+    path.write_text(f"foo @{path}")
+    with pytest.raises(ResponseFileError):
+        expand_response_files([f"@{path}"], max_depth=3)
+
+
+def test_expand_response_files_missing(tmp_path):
+    with pytest.raises(ResponseFileError):
+        expand_response_files([f"@{tmp_path / 'missing.txt'}"])
+
+
+@pytest.mark.parametrize("content", ['foo "bar', "foo 'bar", "foo bar\\", 'foo "bar\\'])
+def test_expand_response_files_invalid(tmp_path, content):
+    path = tmp_path / "args.txt"
+    path.write_text(content)
+    with pytest.raises(ResponseFileError):
+        expand_response_files([f"@{path}"])
+
+
+def test_app_response_files(app, tmp_path):
+    path = tmp_path / "args.txt"
+    path.write_text("\n".join(str(i) for i in range(1000)) + "\n--flag\n")
+
+    @app.default
+    def default(values: List[int], *, flag: bool = False):
+        return values, flag
+
+    # Disabled by default.
+    with pytest.raises(CoercionError):
+        app([f"@{path}"], exit_on_error=False, print_error=False)
+
+    app.response_files = True
+    assert app([f"@{path}"], exit_on_error=False) == (list(range(1000)), True)
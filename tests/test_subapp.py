@@ -67,3 +67,24 @@ def test_resolve_default_parameter_2():
 
     actual_parameter = resolve_default_parameter_from_apps([parent_app_1, sub_app])
     assert actual_parameter == Parameter("bar")
+
+
+def test_subapp_command_entry_promotion(app, console):
+    @app.command(help="Foo help.")
+    def foo(a: int):
+        return a
+
+    entry = app._commands["foo"]
+    assert not isinstance(entry, App)
+
+    with console.capture():
+        app.help_print([], console=console)
+    assert app._commands["foo"] is entry  # Help listing does not promote.
+
+    assert app(["foo", "1"]) == 1
+
+    sub_app = app["foo"]
+    assert isinstance(sub_app, App)
+    assert sub_app is app["foo"]
+    assert sub_app.help == "Foo help."
+    assert sub_app.name == ("foo",)
@@ -1,8 +1,9 @@
+import sys
 from typing import List
 
 import pytest
 
-from cyclopts.utils import ParameterDict, signature
+from cyclopts.utils import ParameterDict, clear_signature_cache, signature
 
 
 @pytest.fixture
@@ -59,3 +60,51 @@ def test_parameter_dict_invalid_contains(parameter_dict):
         # Assert is only here to make the linter happy.
         # Tests __contains__ magic method.
         assert "foo" not in parameter_dict  # pyright: ignore[reportUnusedExpression]
+
+
+def test_signature_cached():
+    def foo(a: "int", b: int = 3):
+        pass
+
+    actual = signature(foo)
+    assert actual is signature(foo)
+    if sys.version_info >= (3, 10):
+        assert actual.parameters["a"].annotation is int
+
+
+def test_signature_cached_bound_method():
+    class Foo:
+        def bar(self, a: int):
+            pass
+
+    foo = Foo()
+    actual = signature(foo.bar)
+    assert list(actual.parameters) == ["a"]
+    assert actual is signature(Foo().bar)
+    assert list(signature(Foo.bar).parameters) == ["self", "a"]
+
+
+def test_signature_unhashable_callable():
+    class Foo:
+        __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+        def __call__(self, a: int):
+            pass
+
+    assert list(signature(Foo()).parameters) == ["a"]
+
+
+def test_signature_clear_cache():
+    def foo(a: int):
+        pass
+
+    before = signature(foo)
+    foo.__annotations__["a"] = str
+
+    assert signature(foo) is before
+    clear_signature_cache(foo)
+    assert signature(foo).parameters["a"].annotation is str
+
+    before = signature(foo)
+    clear_signature_cache()
+    assert signature(foo) is not before
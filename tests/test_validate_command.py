@@ -1,9 +1,17 @@
+import sys
 from typing import Tuple, Union
 
 import pytest
 
+import cyclopts.core
+from cyclopts import Parameter
 from cyclopts.parameter import validate_command
 
+if sys.version_info < (3, 9):
+    from typing_extensions import Annotated
+else:
+    from typing import Annotated
+
 
 def test_validate_command():
     def f1():
@@ -31,3 +39,24 @@ def test_validate_command():
         pass
 
     validate_command(f5)
+
+
+def test_validate_command_once_per_resolution(app, mocker):
+    def foo(a: int):
+        return a
+
+    app.default_command = foo
+    spy = mocker.spy(cyclopts.core, "validate_command")
+
+    assert app("1") == 1
+    assert app("2") == 2
+    spy.assert_called_once_with(foo)
+
+
+def test_validate_command_direct_assignment(app):
+    def foo(a: Annotated[int, Parameter(parse=False)]):
+        pass
+
+    app.default_command = foo
+    with pytest.raises(ValueError):
+        app([], exit_on_error=False)